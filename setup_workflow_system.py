@@ -6,1605 +6,1883 @@ Automatically configures the agent workflow orchestration system for any IDE/env
 
 import os
 import json
-import shutil
 import sys
-import platform
+import contextlib
+import threading
+import time
 from pathlib import Path
-from datetime import datetime
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # Optional speedup - the standard json module is the fallback
+    orjson = None
 
 # Validate required dependencies
 def validate_dependencies():
     """
     # @codebase-summary: Cross-platform dependency validation system
-    - Validates Python standard library availability for workflow system
+    - Validates the Python version required by the workflow system
     - Ensures compatibility across different IDE environments
     - Used by: setup automation, environment validation, deployment checks
     """
-    try:
-        import json, os, shutil, platform
-        from pathlib import Path
-        from datetime import datetime
+    # Everything used is standard library, so the interpreter version is the only real requirement
+    if sys.version_info >= (3, 11):
         return True
-    except ImportError as e:
-        print(f"❌ Missing required dependency: {e}")
-        print("Please ensure Python 3.7+ is installed with standard libraries")
+    print(f"❌ Unsupported Python version: {sys.version.split()[0]}")
+    print("Please ensure Python 3.11+ is installed with standard libraries")
+    return False
+
+def _atomic_write(path, content):
+    """Write content to a temp file beside path, then move it into place with a single os.replace"""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    tmp_path = os.fspath(path) + ".tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except OSError:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+
+def _kernel_copy(copy_chunk, size):
+    """Drive a kernel copy primitive until size bytes are copied; returns False if it is unsupported here"""
+    offset = 0
+    try:
+        while offset < size:
+            copied = copy_chunk(offset, size - offset)
+            if copied == 0:
+                break
+            offset += copied
+    except OSError:
+        # Unsupported for this file pair (EXDEV, ENOSYS, non-socket sendfile target...): fall back
+        # to the next strategy, but only if nothing has been written yet
+        if offset:
+            raise
         return False
-
-class WorkflowSystemSetup:
-    """
-    # @codebase-summary: Core workflow system setup orchestrator
-    - Manages cross-platform workflow system installation and configuration
-    - Detects IDE environment and adapts setup procedures accordingly
-    - Handles file copying, configuration, and validation
-    - Used by: project initialization, environment setup, deployment automation
-    """
-    def __init__(self):
-        self.package_root = Path(__file__).parent
-        self.deployment_context = self._detect_deployment_context()
-        self.project_root = self._determine_project_root()
-        self.detected_ide = self._detect_ide_environment()
-        self.existing_architecture = self._scan_existing_architecture()
-
-    def _detect_deployment_context(self):
-        """
-        # @codebase-summary: Deployment context detection system
-        - Detects if Arkival is being deployed as new project root or integrated into existing project
-        - Analyzes directory structure to determine deployment strategy
-        - Used by: setup automation, integration strategy, file placement decisions
-        """
-        current_dir = Path.cwd()
-        arkival_dir = self.package_root
-        
-        # Check if we're running from within a cloned Arkival directory
-        if current_dir.name.lower() in ['arkival', 'arkival-v4'] and current_dir.parent != current_dir:
-            # We're in /Arkival folder - this is existing project integration
-            print("🔍 Detected: Running from cloned Arkival directory")
-            return 'existing_project_integration'
-        
-        # Check if we're in the Arkival source directory (workspace)
-        if arkival_dir.name.lower() == 'workspace':
-            return 'new_project'
-        
-        # Check if parent directory has existing project structure
-        parent_dir = current_dir.parent
-        existing_indicators = [
-            'package.json', 'src/', 'app/', 'components/', 'public/', 
-            '.git/', 'node_modules/', 'requirements.txt', 'Cargo.toml',
-            'pom.xml', 'build.gradle', 'composer.json', 'README.md'
-        ]
-        
-        parent_count = sum(1 for indicator in existing_indicators 
-                          if (parent_dir / indicator).exists())
-        
-        if parent_count >= 2:
-            return 'existing_project_integration'
-        
-        return 'new_project'
-    
-    def _determine_project_root(self):
-        """
-        # @codebase-summary: Project root determination for flexible deployment
-        - Determines appropriate project root based on deployment context
-        - Handles both new project and existing project integration scenarios
-        - Used by: file placement, configuration generation, deployment strategy
-        """
-        current_dir = Path.cwd()
-        
-        # If we're in /Arkival folder, the project root is the parent directory
-        if current_dir.name.lower() in ['arkival', 'arkival-v4'] and self.deployment_context == 'existing_project_integration':
-            return current_dir.parent  # Parent directory is the actual project root
-        else:
-            return current_dir  # For new projects or source development
-    
-    def _scan_existing_architecture(self):
-        """
-        # @codebase-summary: Existing project architecture scanning system
-        - Scans for existing project files that should be preserved during integration
-        - Identifies technology stack, build tools, and workflow configurations
-        - Used by: integration strategy, conflict avoidance, selective deployment
-        """
-        if self.deployment_context == 'new_project':
-            return {}
-            
-        architecture = {
-            'technology_stack': [],
-            'existing_files': [],
-            'config_files': [],
-            'build_tools': [],
-            'important_directories': []
+    if offset < size:
+        # Some filesystems answer 0 instead of an error for these calls - fall back if nothing was
+        # copied, but a copy that stalls part-way is an error rather than a silently short file
+        if offset == 0:
+            return False
+        raise OSError(f"kernel copy stopped after {offset} of {size} bytes")
+    return True
+
+def _fastcopy(src, dst):
+    """Copy src to a new file dst in the kernel where possible; returns False if dst exists"""
+    import shutil
+
+    with open(src, 'rb') as fsrc:
+        try:
+            fdst = open(dst, 'xb')
+        except FileExistsError:
+            return False
+        try:
+            with fdst:
+                in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+                size = os.fstat(in_fd).st_size
+                copied = False
+                # copy_file_range can reflink or copy server-side; sendfile still skips the userspace bounce
+                if hasattr(os, 'copy_file_range') and sys.platform.startswith('linux'):
+                    copied = _kernel_copy(
+                        lambda offset, count: os.copy_file_range(in_fd, out_fd, count, offset, offset), size)
+                if not copied and hasattr(os, 'sendfile'):
+                    copied = _kernel_copy(
+                        lambda offset, count: os.sendfile(out_fd, in_fd, offset, count), size)
+                if not copied:
+                    buffer = memoryview(bytearray(1024 * 1024))
+                    while n := fsrc.readinto(buffer):
+                        fdst.write(buffer[:n])
+        except BaseException:
+            # Never leave a truncated copy behind - a later run would preserve it as an existing file
+            Path(dst).unlink(missing_ok=True)
+            raise
+    shutil.copystat(src, dst)
+    return True
+
+def _utc_iso(t):
+    """Format a time.time() value as an ISO 8601 UTC timestamp with microseconds"""
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(t)) + f'.{int((t % 1) * 1e6):06d}Z'
+
+def _dumps_json(obj):
+    """Serialize obj to 2-space indented JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+# VS Code settings never vary between runs, so they are serialized once at import time
+VSCODE_SETTINGS_JSON = _dumps_json({
+    "python.defaultInterpreterPath": "python3",
+    "terminal.integrated.defaultProfile.linux": "bash",
+    "terminal.integrated.defaultProfile.osx": "zsh",
+    "files.associations": {
+        "*.json": "jsonc"
+    },
+    "json.schemas": [
+        {
+            "fileMatch": ["workflow_config.json"],
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "project_name": {"type": "string"},
+                    "version": {"type": "string"},
+                    "workflow_settings": {"type": "object"}
+                }
+            }
         }
-        
-        # Scan for technology indicators
-        current_dir = Path.cwd()
-        
-        # Frontend frameworks and build tools
-        if (current_dir / 'package.json').exists():
-            architecture['technology_stack'].append('Node.js/npm')
-            architecture['config_files'].append('package.json')
-        
-        if (current_dir / 'vite.config.js').exists() or (current_dir / 'vite.config.ts').exists():
-            architecture['technology_stack'].append('Vite')
-        
-        if (current_dir / 'next.config.js').exists():
-            architecture['technology_stack'].append('Next.js')
-        
-        if (current_dir / 'vue.config.js').exists():
-            architecture['technology_stack'].append('Vue.js')
-        
-        # Backend frameworks
-        if (current_dir / 'requirements.txt').exists():
-            architecture['technology_stack'].append('Python')
-            architecture['config_files'].append('requirements.txt')
-        
-        if (current_dir / 'Cargo.toml').exists():
-            architecture['technology_stack'].append('Rust')
-            
-        if (current_dir / 'pom.xml').exists():
-            architecture['technology_stack'].append('Java/Maven')
-        
-        # Important directories to preserve
-        for dirname in ['src', 'app', 'components', 'public', 'assets', 'lib', 'utils', 'styles']:
-            if (current_dir / dirname).exists():
-                architecture['important_directories'].append(dirname)
-        
-        return architecture
+    ]
+})
+
+# VS Code tasks are static too; serialized and encoded once at import time
+VSCODE_TASKS_JSON = _dumps_json({
+    "version": "2.0.0",
+    "tasks": [
+        {
+            "label": "Agent Incoming Workflow",
+            "type": "shell",
+            "command": "python3",
+            "args": ["codebase_summary/agent_workflow_orchestrator.py", "incoming"],
+            "group": "build",
+            "presentation": {
+                "echo": True,
+                "reveal": "always",
+                "focus": False,
+                "panel": "shared"
+            },
+            "problemMatcher": []
+        },
+        {
+            "label": "Agent Outgoing Workflow",
+            "type": "shell",
+            "command": "python3",
+            "args": ["codebase_summary/agent_workflow_orchestrator.py", "outgoing", "--summary", "${input:sessionSummary}", "--type", "${input:sessionType}"],
+            "group": "build",
+            "presentation": {
+                "echo": True,
+                "reveal": "always",
+                "focus": False,
+                "panel": "shared"
+            },
+            "problemMatcher": []
+        },
+        {
+            "label": "Update Changelog",
+            "type": "shell",
+            "command": "python3",
+            "args": ["codebase_summary/update_changelog.py", "add", "--summary", "${input:changelogSummary}"],
+            "group": "build",
+            "presentation": {
+                "echo": True,
+                "reveal": "always",
+                "focus": False,
+                "panel": "shared"
+            },
+            "problemMatcher": []
+        }
+    ],
+    "inputs": [
+        {
+            "id": "sessionSummary",
+            "description": "Session summary for handoff",
+            "default": "Completed development session",
+            "type": "promptString"
+        },
+        {
+            "id": "sessionType",
+            "description": "Session completion type",
+            "default": "completed",
+            "type": "pickString",
+            "options": ["completed", "unresolved", "partial"]
+        },
+        {
+            "id": "changelogSummary",
+            "description": "Changelog entry summary",
+            "default": "Updated project features",
+            "type": "promptString"
+        }
+    ]
+})
+
+class SetupError(Exception):
+    """Raised when the project root cannot safely receive the workflow system files"""
+
+# IDE indicators in detection priority order: ('env', variable) or ('dir', project-relative directory)
+IDE_MARKERS = (
+    ('env', 'REPLIT_DB_URL', 'replit'),
+    ('env', 'CODESPACES', 'codespaces'),
+    ('env', 'GITPOD_WORKSPACE_URL', 'gitpod'),
+    ('dir', '.vscode', 'vscode'),
+    ('dir', '.cursor', 'cursor'),
+    ('env', 'WINDSURF_SESSION', 'windsurf'),
+    ('env', 'LOVABLE_PROJECT', 'lovable')
+)
+
+WORKFLOW_METHODS = {
+    'replit': 'replit_workflows',
+    'vscode': 'vscode_tasks',
+    'cursor': 'vscode_tasks',
+    'codespaces': 'vscode_tasks',
+    'gitpod': 'gitpod_tasks',
+    'windsurf': 'shell_scripts',
+    'lovable': 'shell_scripts',
+    'generic': 'shell_scripts'
+}
+
+TASK_RUNNERS = {
+    'replit': 'replit_workflows',
+    'vscode': 'vscode_tasks',
+    'cursor': 'vscode_tasks',
+    'codespaces': 'vscode_tasks',
+    'gitpod': 'gitpod_tasks',
+    'windsurf': 'npm_scripts',
+    'lovable': 'npm_scripts',
+    'generic': 'shell_scripts'
+}
+
+# IDEs that use VS Code tasks and settings
+VSCODE_IDES = frozenset({'vscode', 'cursor', 'codespaces'})
+
+RECOMMENDED_VSCODE_EXTENSIONS = (
+    "ms-python.python",
+    "ms-vscode.vscode-json",
+    "bradlc.vscode-tailwindcss",
+    "esbenp.prettier-vscode"
+)
+
+# Core system files copied into a new project as (package source, project destination)
+CORE_FILES = (
+    ("codebase_summary/agent_workflow_orchestrator.py", "codebase_summary/agent_workflow_orchestrator.py"),
+    ("codebase_summary/update_changelog.py", "codebase_summary/update_changelog.py"),
+    ("codebase_summary/update_project_summary.py", "codebase_summary/update_project_summary.py"),
+    ("NEW_AGENT_GREETING.md", "NEW_AGENT_GREETING.md"),
+    ("DEVELOPER_ONBOARDING.md", "DEVELOPER_ONBOARDING.md"),
+    ("AGENT_GUIDE.md", "AGENT_GUIDE.md")
+)
+
+# Written after a successful setup; a matching fingerprint lets a re-run skip straight to verification
+SETUP_STAMP_PATH = ".workflow_system/.setup_stamp"
+
+# Directories the setup writes into, checked by the preflight before any file is created
+PREFLIGHT_DIRECTORIES = (
+    "codebase_summary",
+    ".workflow_system",
+    ".workflow_system/scripts",
+    ".vscode",
+    "arkival_docs"
+)
+
+# Files verified after setup, including IDE-specific configuration ('default' covers script-based IDEs)
+_VERIFIED_CORE_FILES = (
+    "codebase_summary/agent_workflow_orchestrator.py",
+    "codebase_summary/update_changelog.py",
+    "changelog_summary.json",
+    "NEW_AGENT_GREETING.md",
+    "workflow_config.json",
+    "SETUP_GUIDE.md"
+)
+_VERIFIED_VSCODE_FILES = _VERIFIED_CORE_FILES + (".vscode/tasks.json", ".vscode/settings.json")
+REQUIRED_FILES_BY_IDE = {
+    'vscode': _VERIFIED_VSCODE_FILES,
+    'cursor': _VERIFIED_VSCODE_FILES,
+    'codespaces': _VERIFIED_VSCODE_FILES,
+    'gitpod': _VERIFIED_CORE_FILES + (".gitpod.yml",),
+    'default': _VERIFIED_CORE_FILES + (
+        ".workflow_system/scripts/agent_incoming.sh",
+        ".workflow_system/scripts/agent_outgoing.sh"
+    )
+}
+
+# Replit workflow definitions; the .replit file is the module/nix header followed by the same workflows
+REPLIT_WORKFLOWS_CONFIG = '''[[workflows.workflow]]
+name = "Agent Incoming Workflow"
+author = "workflow-system"
+mode = "sequential"
 
-    def _detect_ide_environment(self):
-        """Detect the current IDE/development environment"""
-        # Check for various IDE indicators
-        if os.environ.get('REPLIT_DB_URL'):
-            return 'replit'
-        elif os.environ.get('CODESPACES'):
-            return 'codespaces'
-        elif os.environ.get('GITPOD_WORKSPACE_URL'):
-            return 'gitpod'
-        elif (self.project_root / '.vscode').exists():
-            return 'vscode'
-        elif (self.project_root / '.cursor').exists():
-            return 'cursor'
-        elif os.environ.get('WINDSURF_SESSION'):
-            return 'windsurf'
-        elif os.environ.get('LOVABLE_PROJECT'):
-            return 'lovable'
-        else:
-            return 'generic'
+[[workflows.workflow.tasks]]
+task = "shell.exec"
+args = "echo '🎯 NEW AGENT ONBOARDING WORKFLOW'"
 
-    def setup_new_project(self):
-        """
-        # @codebase-summary: New project setup for Arkival workflow system
-        - Sets up complete workflow system for new project deployment
-        - Creates all necessary files, directories, and configurations
-        - Used by: new project initialization, clean deployment scenarios
-        """
-        print("🚀 SETTING UP NEW PROJECT WITH ARKIVAL WORKFLOW SYSTEM")
-        print("=" * 70)
-        print(f"📍 Detected environment: {self.detected_ide.upper()}")
+[[workflows.workflow.tasks]]
+task = "shell.exec"
+args = "python3 codebase_summary/agent_workflow_orchestrator.py incoming"
 
-        try:
-            # Step 1: Create directory structure
-            self._create_directory_structure()
+[[workflows.workflow]]
+name = "Agent Outgoing Workflow"
+author = "workflow-system"
+mode = "sequential"
 
-            # Step 2: Copy core system files
-            self._copy_core_files()
+[[workflows.workflow.tasks]]
+task = "shell.exec"
+args = "echo '🚀 OUTGOING AGENT HANDOFF WORKFLOW'"
 
-            # Step 3: Initialize project configuration
-            self._initialize_project_config()
+[[workflows.workflow.tasks]]
+task = "shell.exec"
+args = "python3 codebase_summary/agent_workflow_orchestrator.py outgoing --summary \\"Session summary\\" --type completed"
+'''
+REPLIT_FILE_CONFIG = '''modules = ["python-3.11", "nodejs-20", "python3"]
 
-            # Step 4: Set up changelog system
-            self._initialize_changelog()
+[nix]
+channel = "stable-24_05"
+packages = ["libyaml"]
 
-            # Step 5: Configure IDE-specific workflows
-            self._setup_ide_workflows()
+''' + REPLIT_WORKFLOWS_CONFIG
 
-            # Step 6: Create initial documentation
-            self._create_initial_documentation()
+GITPOD_CONFIG = """
+tasks:
+  - name: Agent Workflow System
+    init: |
+      echo "🎯 Agent Workflow System Ready"
+      echo "Available commands:"
+      echo "- gp tasks:run 'Agent Incoming Workflow'"
+      echo "- gp tasks:run 'Agent Outgoing Workflow'"
+    command: |
+      echo "Workflow system ready. Use 'python3 codebase_summary/agent_workflow_orchestrator.py incoming' to start."
 
-            # Step 7: Create community standards files
-            self._create_community_standards_files()
+vscode:
+  extensions:
+    - ms-python.python
+    - ms-vscode.vscode-json
+"""
 
-            # Step 8: Set up IDE integration files
-            self._setup_ide_integration()
+# Fallback workflow scripts, created under .workflow_system/scripts/ for every IDE
+SHELL_SCRIPTS = {
+    "agent_incoming.sh": """#!/bin/bash
+echo "🎯 NEW AGENT ONBOARDING WORKFLOW"
+echo "================================"
+python3 codebase_summary/agent_workflow_orchestrator.py incoming
+echo ""
+echo "✅ Incoming workflow completed."
+""",
+    "agent_outgoing.sh": """#!/bin/bash
+echo "🚀 OUTGOING AGENT HANDOFF WORKFLOW"
+echo "=================================="
+if [ -z "$1" ]; then
+    echo "Usage: ./agent_outgoing.sh \"Session summary\" [completed|unresolved]"
+    echo "Example: ./agent_outgoing.sh \"Implemented new features\" completed"
+    exit 1
+fi
+SUMMARY="$1"
+TYPE="${2:-completed}"
+python3 codebase_summary/agent_workflow_orchestrator.py outgoing --summary "$SUMMARY" --type "$TYPE"
+""",
+    "update_changelog.sh": """#!/bin/bash
+if [ -z "$1" ]; then
+    echo "Usage: ./update_changelog.sh \"Change summary\""
+    echo "Example: ./update_changelog.sh \"Added new login functionality\""
+    exit 1
+fi
+python3 codebase_summary/update_changelog.py add --summary "$1"
+"""
+}
 
-            # Step 9: Run initial system check
-            self._run_system_verification()
+# Community standards files placed in arkival_docs/ during new project setup
+LICENSE_TEMPLATE = """Attribution License
 
-            print("\n✅ ARKIVAL WORKFLOW SYSTEM SETUP COMPLETED!")
-            print("=" * 70)
-            print("Next steps:")
-            print("1. Edit workflow_config.json with your project details")
-            print("2. Review IDE-specific setup instructions in SETUP_GUIDE.md")
-            print("3. Say 'Hi' to test the incoming agent workflow")
-            print("4. Begin development with full workflow support")
+Copyright (c) 2025 Spitfire Products
 
-        except Exception as e:
-            print(f"❌ Setup failed: {e}")
-            sys.exit(1)
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
 
-    def setup_existing_project_integration(self):
-        """
-        # @codebase-summary: Existing project integration for Arkival workflow system
-        - Integrates Arkival into existing projects without overwriting files
-        - Places Arkival files in arkival/ subdirectory to avoid conflicts
-        - Preserves existing project structure and workflows
-        - Used by: existing project integration, non-destructive deployment
-        """
-        print("🔧 INTEGRATING ARKIVAL INTO EXISTING PROJECT")
-        print("=" * 70)
-        print(f"📍 Detected environment: {self.detected_ide.upper()}")
-        print(f"🏗️ Existing architecture: {', '.join(self.existing_architecture.get('technology_stack', ['Unknown']))}")
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
 
-        try:
-            # Step 1: Create arkival_config.json trigger file in parent
-            self._create_arkival_config()
-            
-            print("✅ Arkival integration completed - no files copied, everything stays in Arkival-V4/")
+Attribution to Spitfire Products must be maintained in all copies, substantial
+portions, derivative works, and distributions of the Software. This includes
+but is not limited to:
+- Source code headers and comments
+- Documentation and README files
+- User interfaces and about pages
+- Distribution packages and releases
 
-            print("\n✅ ARKIVAL INTEGRATION COMPLETED!")
-            print("=" * 70)
-            print("Integration summary:")
-            print("• Only arkival_config.json added to parent directory")
-            print("• All Arkival files remain in Arkival-V4/ directory")
-            print("• Run workflows from: python3 Arkival-V4/codebase_summary/agent_workflow_orchestrator.py")
-            print("• Everything self-contained in Arkival-V4/")
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
 
-        except Exception as e:
-            print(f"❌ Integration failed: {e}")
-            sys.exit(1)
+Original work by Spitfire Products
+Arkival - AI Agent Workflow Orchestration System
+"""
 
-    def _create_arkival_subdirectory(self):
-        """
-        # @codebase-summary: Arkival subdirectory creation for existing project integration
-        - Creates arkival/ subdirectory structure for non-destructive integration
-        - Preserves existing project structure while adding Arkival capabilities
-        - Used by: existing project integration, conflict-free deployment
-        """
-        arkival_base = self.project_root / "arkival"
-        
-        directories = [
-            "arkival/codebase_summary",
-            "arkival/codebase_summary/history", 
-            "arkival/.workflow_system",
-            "arkival/.workflow_system/scripts",
-            "arkival/.workflow_system/ide_configs"
-        ]
+CONTRIBUTING_TEMPLATE = """# Contributing to Arkival
 
-        for directory in directories:
-            dir_path = self.project_root / directory
-            try:
-                dir_path.mkdir(parents=True, exist_ok=True)
-                print(f"📁 Created: {directory}")
-            except Exception as e:
-                print(f"❌ Failed to create {directory}: {e}")
+Thank you for your interest in contributing! Arkival enables seamless knowledge transfer between AI agents and human developers across different development environments.
 
-    def _copy_arkival_files(self):
-        """
-        # @codebase-summary: Arkival file copying for existing project integration
-        - Copies Arkival system files to arkival/ subdirectory
-        - Avoids overwriting existing project files
-        - Used by: existing project integration, selective file deployment
-        """
-        core_files = [
-            ("codebase_summary/agent_workflow_orchestrator.py", "arkival/codebase_summary/agent_workflow_orchestrator.py"),
-            ("codebase_summary/update_changelog.py", "arkival/codebase_summary/update_changelog.py"),
-            ("codebase_summary/update_project_summary.py", "arkival/codebase_summary/update_project_summary.py"),
-            ("NEW_AGENT_GREETING.md", "arkival/NEW_AGENT_GREETING.md"),
-            ("DEVELOPER_ONBOARDING.md", "arkival/DEVELOPER_ONBOARDING.md"),
-            ("AGENT_GUIDE.md", "arkival/AGENT_GUIDE.md")
-        ]
+## Getting Started
 
-        for source, dest in core_files:
-            source_path = self.package_root / source
-            dest_path = self.project_root / dest
+1. Fork the repository
+2. Clone your fork locally
+3. Run the setup script: `python3 setup_workflow_system.py`
+4. Test your changes with: `python3 validate_deployment.py`
 
-            if source_path.exists():
-                try:
-                    # Ensure destination directory exists
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    # SAFETY CHECK: Never overwrite existing files
-                    if dest_path.exists():
-                        print(f"⏭️  Skipping {dest} - already exists (preserving existing file)")
-                        continue
-                    
-                    shutil.copy2(source_path, dest_path)
-                    print(f"📄 Copied to arkival/: {dest.replace('arkival/', '')}")
-                except Exception as e:
-                    print(f"❌ Failed to copy {dest}: {e}")
-            else:
-                print(f"⚠️  Source file not found: {source}")
+## Development Process
 
-    def _create_integration_config(self):
-        """
-        # @codebase-summary: Integration-specific configuration generation
-        - Creates Arkival configuration that works with existing project
-        - Includes detected technology stack and existing architecture info
-        - Used by: existing project integration, context-aware configuration
-        """
-        config = {
-            "_generator": "Generated by setup_workflow_system.py - Arkival integration for existing project",
-            "deployment_mode": "existing_project_integration",
-            "project_name": f"Existing Project + Arkival",
-            "project_description": f"Existing {', '.join(self.existing_architecture.get('technology_stack', ['Unknown']))} project with Arkival workflow integration",
-            "version": "1.0.0",
-            "technology_stack": self.existing_architecture.get('technology_stack', ['Unknown']),
-            "existing_architecture": self.existing_architecture,
-            "environment": {
-                "detected_ide": self.detected_ide,
-                "platform": platform.system(),
-                "supports_integrated_terminal": True,
-                "supports_tasks": self.detected_ide in ['vscode', 'cursor', 'codespaces']
-            },
-            "workflow_settings": {
-                "auto_changelog": True,
-                "auto_documentation": True,
-                "cost_optimization": True,
-                "agent_handoff_enabled": True,
-                "ide_integration": True,
-                "arkival_subdirectory": True
-            },
-            "integration_notes": {
-                "arkival_location": "arkival/",
-                "original_project_preserved": True,
-                "workflow_commands": "Run from arkival/ subdirectory",
-                "configuration_file": "arkival/workflow_config.json"
-            },
-            "setup_timestamp": datetime.now().isoformat() + "Z"
-        }
+### Setting up the Development Environment
 
-        config_path = self.project_root / "arkival" / "workflow_config.json"
-        try:
-            # Ensure parent directory exists
-            config_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # SAFETY CHECK: Even in arkival subdirectory, don't overwrite
-            if config_path.exists():
-                print(f"⏭️  Skipping arkival/workflow_config.json - already exists")
-                return
-                
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
-            print(f"⚙️  Created arkival/workflow_config.json")
-        except Exception as e:
-            print(f"❌ Failed to create integration config: {e}")
-    
-    def _create_arkival_config(self):
-        """Create arkival_config.json trigger file in project root"""
-        try:
-            # Detect the actual Arkival directory name
-            current_dir = Path.cwd()
-            arkival_dir_name = current_dir.name if current_dir.name.lower() in ['arkival', 'arkival-v4'] else 'Arkival-V4'
-            
-            # Simple trigger file for subdirectory mode detection
-            config = {
-                "arkival_integration": True,
-                "version": "4.0",
-                "deployment_mode": "subdirectory",
-                "arkival_directory": arkival_dir_name,
-                "created_at": datetime.now().isoformat(),
-                "note": "This file enables Arkival subdirectory mode detection"
-            }
-            
-            config_path = self.project_root / "arkival_config.json"
-            
-            # SAFETY CHECK: Don't overwrite existing config
-            if config_path.exists():
-                print("⏭️  Skipping arkival_config.json - already exists")
-                return
-            
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
-            print("⚙️  Created arkival_config.json (enables subdirectory mode)")
-            
-        except Exception as e:
-            print(f"❌ Failed to create arkival_config.json: {e}")
-            
-        # Migrate .scanignore to parent root for subdirectory deployments
-        self._migrate_scanignore_to_parent()
+```bash
+# Clone the repository
+git clone https://github.com/Spitfire-Products/Arkival-V4.git
+cd arkival
 
-    def _migrate_scanignore_to_parent(self):
-        """Migrate .scanignore to parent project root in subdirectory mode"""
-        try:
-            source_scanignore = self.package_root / ".scanignore"
-            target_scanignore = self.project_root / ".scanignore"
-            
-            if not source_scanignore.exists():
-                print("⚠️  No .scanignore found in Arkival directory")
-                return
-                
-            if target_scanignore.exists():
-                print("⏭️  Skipping .scanignore migration - already exists in parent")
-                return
-                
-            # Copy .scanignore to parent project root
-            import shutil
-            shutil.copy2(source_scanignore, target_scanignore)
-            print("⚙️  Migrated .scanignore to parent project root")
-            
-        except Exception as e:
-            print(f"❌ Failed to migrate .scanignore: {e}")
+# Run the setup
+python3 setup_workflow_system.py
 
-    def _initialize_arkival_changelog(self):
-        """
-        # @codebase-summary: Arkival-specific changelog initialization for integration
-        - Creates changelog in arkival/ subdirectory for integration tracking
-        - Preserves existing project changelog if present
-        - Used by: existing project integration, change tracking isolation
-        """
-        changelog = {
-            "_generator": "Generated by setup_workflow_system.py - Arkival integration changelog",
-            "project_name": f"Arkival Integration",
-            "changelog_version": "1.0.0",
-            "last_updated": datetime.now().isoformat() + "Z",
-            "description": "Arkival workflow system integration tracking",
-            "integration_mode": True,
-            "entries": [
-                {
-                    "id": "integration_001",
-                    "timestamp": datetime.now().isoformat() + "Z",
-                    "author": "Arkival Setup",
-                    "version": "1.0.0",
-                    "type": "feature",
-                    "scope": "integration",
-                    "summary": "Integrated Arkival workflow system into existing project",
-                    "description": f"Added Arkival workflow capabilities to existing {', '.join(self.existing_architecture.get('technology_stack', ['Unknown']))} project without modifying original files",
-                    "files_changed": [
-                        {
-                            "file": "arkival/",
-                            "action": "created",
-                            "changes": ["Arkival workflow system integration"]
-                        }
-                    ],
-                    "breaking_changes": False,
-                    "migration_notes": "No migration required - integration preserves existing structure",
-                    "related_issues": [],
-                    "tags": ["arkival", "integration", "workflow"]
-                }
-            ]
-        }
+# Validate the setup
+python3 validate_deployment.py
+```
 
-        changelog_path = self.project_root / "arkival" / "changelog_summary.json"
-        try:
-            # Ensure parent directory exists
-            changelog_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # SAFETY CHECK: Even in arkival subdirectory, don't overwrite
-            if changelog_path.exists():
-                print("⏭️  Skipping arkival/changelog_summary.json - already exists")
-                return
-                
-            with open(changelog_path, 'w', encoding='utf-8') as f:
-                json.dump(changelog, f, indent=2)
-            print("📝 Created arkival/changelog_summary.json")
-        except Exception as e:
-            print(f"❌ Failed to create arkival changelog: {e}")
+### Making Changes
 
-    def _create_integration_documentation(self):
-        """
-        # @codebase-summary: Integration documentation generation
-        - Creates documentation specific to Arkival integration mode
-        - Provides usage instructions for existing project context
-        - Used by: existing project integration, user guidance
-        """
-        integration_guide = f"""# Arkival Integration Guide
+1. Create a feature branch: `git checkout -b feature/your-feature-name`
+2. Make your changes
+3. Add tests for new functionality
+4. Validate the setup: `python3 validate_deployment.py`
+5. Update documentation as needed
+6. Commit your changes with clear messages
 
-## Overview
-Arkival has been successfully integrated into your existing project without modifying any of your original files.
+### Code Style
 
-## Project Structure
-- **Your existing files**: Unchanged and preserved
-- **Arkival files**: Located in `arkival/` directory
-- **Technology Stack Detected**: {', '.join(self.existing_architecture.get('technology_stack', ['Unknown']))}
+- Follow PEP 8 for Python code
+- Use meaningful variable and function names
+- Add docstrings for all functions and classes
+- Include breadcrumb documentation using `@codebase-summary:` format
 
-## Using Arkival Workflows
+### Testing
 
-### Agent Incoming Workflow
-```bash
-python3 arkival/codebase_summary/agent_workflow_orchestrator.py incoming
-```
+- Write tests for new features
+- Ensure all tests pass before submitting
+- Test across different IDE environments when possible
 
-### Agent Outgoing Workflow  
-```bash
-python3 arkival/codebase_summary/agent_workflow_orchestrator.py outgoing --summary "Session summary" --type completed
-```
+### Documentation
 
-### Update Changelog
-```bash
-python3 arkival/codebase_summary/update_changelog.py add --summary "Change description"
-```
+- Update README.md if needed
+- Add or update docstrings
+- Include examples for new features
+- Update CHANGELOG.md following semantic versioning
 
-## Configuration
-- **Arkival Config**: `arkival/workflow_config.json`
-- **Arkival Changelog**: `arkival/changelog_summary.json` 
-- **Your Original Files**: Completely preserved
+## Submitting Changes
 
-## Integration Notes
-- Arkival operates independently in its subdirectory
-- Your existing build processes and workflows remain unchanged
-- You can use Arkival workflows alongside your existing development process
-- No conflicts with your existing project structure
+1. Push your branch to your fork
+2. Submit a pull request
+3. Describe your changes clearly
+4. Link any related issues
 
-## Next Steps
-1. Review `arkival/workflow_config.json` and customize if needed
-2. Test the agent workflows using the commands above
-3. Begin AI collaboration with full workflow support
-4. Your existing project development continues normally
+## Code of Conduct
 
-## Technology Stack Integration
-Detected in your project:
-{chr(10).join(f'- {tech}' for tech in self.existing_architecture.get('technology_stack', ['Unknown']))}
+- Be respectful and inclusive
+- Focus on constructive feedback
+- Help maintain a welcoming environment for all contributors
 
-Existing directories preserved:
-{chr(10).join(f'- {dir_name}/' for dir_name in self.existing_architecture.get('important_directories', []))}
+## Questions?
+
+- Open an issue for bugs or feature requests
+- Start a discussion for general questions
+- Check existing issues before creating new ones
+
+Thank you for contributing to making AI agent workflows more efficient!
 """
 
-        guide_path = self.project_root / "arkival" / "INTEGRATION_GUIDE.md"
-        try:
-            # Ensure parent directory exists  
-            guide_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # SAFETY CHECK: Even in arkival subdirectory, don't overwrite
-            if guide_path.exists():
-                print("⏭️  Skipping arkival/INTEGRATION_GUIDE.md - already exists")
-            else:
-                with open(guide_path, 'w', encoding='utf-8') as f:
-                    f.write(integration_guide)
-                print("📖 Created arkival/INTEGRATION_GUIDE.md")
-        except Exception as e:
-            print(f"❌ Failed to create integration guide: {e}")
+SECURITY_TEMPLATE = """# Security Policy
 
-    def _validate_integration(self):
-        """
-        # @codebase-summary: Integration validation and verification system
-        - Validates that Arkival integration completed successfully
-        - Checks for required files and proper directory structure
-        - Used by: existing project integration, deployment verification
-        """
-        print(f"\n🔍 VALIDATING ARKIVAL INTEGRATION...")
-        
-        required_arkival_files = [
-            "arkival/codebase_summary/agent_workflow_orchestrator.py",
-            "arkival/codebase_summary/update_changelog.py", 
-            "arkival/workflow_config.json",
-            "arkival/changelog_summary.json",
-            "arkival/INTEGRATION_GUIDE.md"
-        ]
-        
-        all_good = True
-        for file_path in required_arkival_files:
-            full_path = self.project_root / file_path
-            if full_path.exists():
-                print(f"✅ {file_path}")
-            else:
-                print(f"❌ {file_path} - MISSING")
-                all_good = False
-                
-        if all_good:
-            print("✅ Arkival integration completed successfully")
-            print("🎯 Your existing project files remain unchanged")
-        else:
-            print("❌ Some Arkival files missing - integration may be incomplete")
+## Supported Versions
 
-    def _create_directory_structure(self):
-        """Create necessary directory structure"""
-        directories = [
-            "codebase_summary",
-            "codebase_summary/history",
-            ".workflow_system",
-            ".workflow_system/scripts",
-            ".workflow_system/ide_configs"
-        ]
+We release patches for security vulnerabilities for the following versions:
 
-        for directory in directories:
-            dir_path = self.project_root / directory
-            try:
-                dir_path.mkdir(parents=True, exist_ok=True)
-                print(f"📁 Created directory: {directory}")
-            except Exception as e:
-                print(f"❌ Failed to create {directory}: {e}")
+| Version | Supported          |
+| ------- | ------------------ |
+| 1.0.x   | :white_check_mark: |
+| < 1.0   | :x:                |
 
-    def _copy_core_files(self):
-        """Copy core system files to project"""
-        core_files = [
-            ("codebase_summary/agent_workflow_orchestrator.py", "codebase_summary/agent_workflow_orchestrator.py"),
-            ("codebase_summary/update_changelog.py", "codebase_summary/update_changelog.py"),
-            ("codebase_summary/update_project_summary.py", "codebase_summary/update_project_summary.py"),
-            ("NEW_AGENT_GREETING.md", "NEW_AGENT_GREETING.md"),
-            ("DEVELOPER_ONBOARDING.md", "DEVELOPER_ONBOARDING.md"),
-            ("AGENT_GUIDE.md", "AGENT_GUIDE.md")
-        ]
+## Reporting a Vulnerability
 
-        for source, dest in core_files:
-            source_path = self.package_root / source
-            dest_path = self.project_root / dest
+We take security vulnerabilities in Arkival seriously.
 
-            # Skip if source and destination are the same file
-            if source_path.resolve() == dest_path.resolve():
-                print(f"✅ Already exists: {dest}")
-                continue
+### How to Report
 
-            if source_path.exists():
-                try:
-                    # Ensure destination directory exists
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    # SAFETY CHECK: Never overwrite existing files
-                    if dest_path.exists():
-                        print(f"⏭️  Skipping {dest} - already exists (preserving existing file)")
-                        continue
-                    
-                    shutil.copy2(source_path, dest_path)
-                    print(f"📄 Copied: {dest}")
-                except Exception as e:
-                    print(f"❌ Failed to copy {dest}: {e}")
-            else:
-                print(f"⚠️  Source file not found: {source}")
+**Please do not report security vulnerabilities through public GitHub issues.**
 
-    def _initialize_project_config(self):
-        """Initialize project configuration with IDE detection"""
-        config = {
-            "_generator": "Generated by setup_workflow_system.py - Cross-platform workflow system setup",
-            "project_name": "New Project",
-            "project_description": "AI-powered application with workflow orchestration",
-            "version": "1.0.0",
-            "technology_stack": ["Generic"],
-            "environment": {
-                "detected_ide": self.detected_ide,
-                "platform": platform.system(),
-                "supports_integrated_terminal": True,
-                "supports_tasks": self.detected_ide in ['vscode', 'cursor', 'codespaces']
-            },
-            "workflow_settings": {
-                "auto_changelog": True,
-                "auto_documentation": True,
-                "cost_optimization": True,
-                "agent_handoff_enabled": True,
-                "ide_integration": True
-            },
-            "customization": {
-                "greeting_triggers": ["hi", "hello", "hey"],
-                "changelog_triggers": ["update the changelog", "update changelog"],
-                "documentation_required": True,
-                "terminal_commands": True
-            },
-            "ide_specific": {
-                "workflow_method": self._get_workflow_method(),
-                "terminal_integration": True,
-                "task_runner": self._get_task_runner(),
-                "extensions_recommended": self._get_recommended_extensions()
-            },
-            "setup_timestamp": datetime.now().isoformat() + "Z"
-        }
+Instead, please send a report to the maintainers privately. Include:
+
+- Type of issue (e.g. buffer overflow, SQL injection, cross-site scripting)
+- Full paths of source file(s) related to the manifestation of the issue
+- The location of the affected source code (tag/branch/commit or direct URL)
+- Any special configuration required to reproduce the issue
+- Step-by-step instructions to reproduce the issue
+- Proof-of-concept or exploit code (if possible)
+- Impact of the issue, including how an attacker might exploit the issue
+
+### Response Timeline
+
+- We will acknowledge receipt of your vulnerability report within 48 hours
+- We will provide a detailed response within 7 days indicating next steps
+- We will work on a fix and coordinate disclosure timeline with you
+
+### Security Best Practices
 
-        config_path = self.project_root / "workflow_config.json"
-        try:
-            # Ensure parent directory exists
-            config_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # SAFETY CHECK: Never overwrite existing config
-            if config_path.exists():
-                print(f"⏭️  Skipping workflow_config.json - already exists (preserving existing configuration)")
-                return
-            
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
-            print(f"⚙️  Created workflow_config.json for {self.detected_ide}")
-        except Exception as e:
-            print(f"❌ Failed to create workflow_config.json: {e}")
+When using this system:
 
-    def _get_workflow_method(self):
-        """Get the workflow method based on IDE"""
-        workflow_methods = {
-            'replit': 'replit_workflows',
-            'vscode': 'vscode_tasks',
-            'cursor': 'vscode_tasks',
-            'codespaces': 'vscode_tasks', 
-            'gitpod': 'gitpod_tasks',
-            'windsurf': 'shell_scripts',
-            'lovable': 'shell_scripts',
-            'generic': 'shell_scripts'
-        }
-        return workflow_methods.get(self.detected_ide, 'shell_scripts')
+1. **API Keys**: Never commit API keys or sensitive credentials to version control
+2. **Environment Variables**: Use environment variables for sensitive configuration
+3. **File Permissions**: Ensure proper file permissions on system files
+4. **Updates**: Keep the system updated to the latest version
+5. **Validation**: Validate all inputs and outputs in your workflows
 
-    def _get_task_runner(self):
-        """Get recommended task runner for IDE"""
-        task_runners = {
-            'replit': 'replit_workflows',
-            'vscode': 'vscode_tasks',
-            'cursor': 'vscode_tasks',
-            'codespaces': 'vscode_tasks',
-            'gitpod': 'gitpod_tasks',
-            'windsurf': 'npm_scripts',
-            'lovable': 'npm_scripts',
-            'generic': 'shell_scripts'
-        }
-        return task_runners.get(self.detected_ide, 'shell_scripts')
+### Safe Usage Guidelines
 
-    def _get_recommended_extensions(self):
-        """Get recommended extensions for IDE"""
-        if self.detected_ide in ['vscode', 'cursor', 'codespaces']:
-            return [
-                "ms-python.python",
-                "ms-vscode.vscode-json",
-                "bradlc.vscode-tailwindcss",
-                "esbenp.prettier-vscode"
-            ]
-        return []
+- Run the system in isolated environments when possible
+- Regularly update dependencies
+- Monitor system logs for unusual activity
+- Use the built-in validation features
+- Follow the principle of least privilege
 
-    def _setup_ide_workflows(self):
-        """Set up IDE-specific workflow configurations"""
-        # Always create shell scripts as fallback
-        self._setup_shell_scripts()
-        
-        # Then create IDE-specific configurations
-        if self.detected_ide == 'replit':
-            self._setup_replit_workflows()
-        elif self.detected_ide in ['vscode', 'cursor', 'codespaces']:
-            self._setup_vscode_tasks()
-        elif self.detected_ide == 'gitpod':
-            self._setup_gitpod_tasks()
+Thank you for helping keep Arkival secure!
+"""
 
-    def _setup_replit_workflows(self):
-        """Set up Replit workflows with proper .replit file integration"""
-        # Create .replit file with workflow integration
-        replit_file_config = '''modules = ["python-3.11", "nodejs-20", "python3"]
+# Community standards files placed in arkival_docs/, pre-encoded once at import time
+COMMUNITY_FILES = (
+    ("ARKIVAL_LICENSE", LICENSE_TEMPLATE.encode('utf-8')),
+    ("ARKIVAL_CONTRIBUTING.md", CONTRIBUTING_TEMPLATE.encode('utf-8')),
+    ("ARKIVAL_SECURITY.md", SECURITY_TEMPLATE.encode('utf-8'))
+)
+
+# Every file a new-project setup writes; a setup stamp only short-circuits the run while all are present
+SETUP_OUTPUT_FILES = (
+    tuple(dest for _, dest in CORE_FILES)
+    + (
+        "workflow_config.json",
+        "changelog_summary.json",
+        "codebase_summary/codebase_summary.json",
+        "SETUP_GUIDE.md",
+        ".gitignore"
+    )
+    + tuple(f"arkival_docs/{filename}" for filename, _ in COMMUNITY_FILES)
+    + tuple(f".workflow_system/scripts/{script_name}" for script_name in SHELL_SCRIPTS)
+)
+_VSCODE_OUTPUT_FILES = (".vscode/tasks.json", ".vscode/settings.json")
+IDE_OUTPUT_FILES = {
+    'replit': (".replit", ".workflow_system/replit_workflows.toml"),
+    'vscode': _VSCODE_OUTPUT_FILES,
+    'cursor': _VSCODE_OUTPUT_FILES,
+    'codespaces': _VSCODE_OUTPUT_FILES,
+    'gitpod': (".gitpod.yml",)
+}
+
+# .gitignore content, pre-encoded since _handle_gitignore works on raw bytes
+ARKIVAL_GITIGNORE_ENTRIES = """
+# Arkival-specific entries
+# =======================
 
-[nix]
-channel = "stable-24_05"
-packages = ["libyaml"]
+# Generated JSON files (should not be committed)
+codebase_summary.json
+changelog_summary.json
+codebase_summary/session_state.json
+codebase_summary/agent_handoff.json
+codebase_summary/missing_breadcrumbs.json
+export_package/agent_handoff.json
 
-[[workflows.workflow]]
-name = "Agent Incoming Workflow"
-author = "workflow-system"
-mode = "sequential"
+# Arkival data directory (subdirectory mode)
+Arkival/data/
 
-[[workflows.workflow.tasks]]
-task = "shell.exec"
-args = "echo '🎯 NEW AGENT ONBOARDING WORKFLOW'"
+# Arkival documentation (kept separate from project docs)
+arkival_docs/
 
-[[workflows.workflow.tasks]]
-task = "shell.exec"
-args = "python3 codebase_summary/agent_workflow_orchestrator.py incoming"
+# IDE-specific files (generated during setup)
+.replit
+.gitpod.yml
 
-[[workflows.workflow]]
-name = "Agent Outgoing Workflow"
-author = "workflow-system"
-mode = "sequential"
+# Environment-specific workflow files
+.workflow_system/
 
-[[workflows.workflow.tasks]]
-task = "shell.exec"
-args = "echo '🚀 OUTGOING AGENT HANDOFF WORKFLOW'"
+# System files
+codebase_summary/history/
 
-[[workflows.workflow.tasks]]
-task = "shell.exec"
-args = "python3 codebase_summary/agent_workflow_orchestrator.py outgoing --summary \\"Session summary\\" --type completed"
-'''
+# Node.js files (not needed for Python project)
+package.json
+package-lock.json
+""".encode('utf-8')
 
-        # Write the main .replit file
-        replit_file_path = self.project_root / ".replit"
-        
-        # SAFETY CHECK: Never overwrite existing .replit file
-        if replit_file_path.exists():
-            print("⏭️  Skipping .replit - already exists (preserving existing Replit configuration)")
-        else:
-            with open(replit_file_path, 'w', encoding='utf-8') as f:
-                f.write(replit_file_config)
-            print("🔧 Created Replit .replit file with integrated workflows")
+STANDARD_GITIGNORE = """# Dependencies
+node_modules/
+__pycache__/
+*.pyc
+*.pyo
+*.pyd
+.Python
+env/
+venv/
+.venv/
 
-        # Also create backup in .workflow_system for reference
-        workflow_path = self.project_root / ".workflow_system" / "replit_workflows.toml"
-        workflow_only_config = '''[[workflows.workflow]]
-name = "Agent Incoming Workflow"
-author = "workflow-system"
-mode = "sequential"
+# IDE
+.vscode/
+.idea/
+*.swp
+*.swo
+*~
 
-[[workflows.workflow.tasks]]
-task = "shell.exec"
-args = "echo '🎯 NEW AGENT ONBOARDING WORKFLOW'"
+# OS
+.DS_Store
+.DS_Store?
+._*
+.Spotlight-V100
+.Trashes
+ehthumbs.db
+Thumbs.db
 
-[[workflows.workflow.tasks]]
-task = "shell.exec"
-args = "python3 codebase_summary/agent_workflow_orchestrator.py incoming"
+# Build outputs
+dist/
+build/
+*.egg-info/
 
-[[workflows.workflow]]
-name = "Agent Outgoing Workflow"
-author = "workflow-system"
-mode = "sequential"
+# Environment variables
+.env
+.env.local
 
-[[workflows.workflow.tasks]]
-task = "shell.exec"
-args = "echo '🚀 OUTGOING AGENT HANDOFF WORKFLOW'"
+# Logs
+logs/
+*.log
 
-[[workflows.workflow.tasks]]
-task = "shell.exec"
-args = "python3 codebase_summary/agent_workflow_orchestrator.py outgoing --summary \\"Session summary\\" --type completed"
-'''
-        # SAFETY CHECK: Don't overwrite existing workflow backup
-        if workflow_path.exists():
-            print("⏭️  Skipping .workflow_system/replit_workflows.toml - already exists")
-        else:
-            with open(workflow_path, 'w', encoding='utf-8') as f:
-                f.write(workflow_only_config)
-            print("🔧 Created Replit workflow configuration backup")
+# Temporary files
+*.tmp
+*.temp
+.tmp/
+temp/
+""".encode('utf-8')
 
-    def _setup_vscode_tasks(self):
-        """Set up VS Code tasks.json"""
-        vscode_tasks = {
-            "version": "2.0.0",
-            "tasks": [
-                {
-                    "label": "Agent Incoming Workflow",
-                    "type": "shell",
-                    "command": "python3",
-                    "args": ["codebase_summary/agent_workflow_orchestrator.py", "incoming"],
-                    "group": "build",
-                    "presentation": {
-                        "echo": True,
-                        "reveal": "always",
-                        "focus": False,
-                        "panel": "shared"
-                    },
-                    "problemMatcher": []
-                },
-                {
-                    "label": "Agent Outgoing Workflow",
-                    "type": "shell",
-                    "command": "python3",
-                    "args": ["codebase_summary/agent_workflow_orchestrator.py", "outgoing", "--summary", "${input:sessionSummary}", "--type", "${input:sessionType}"],
-                    "group": "build",
-                    "presentation": {
-                        "echo": True,
-                        "reveal": "always",
-                        "focus": False,
-                        "panel": "shared"
-                    },
-                    "problemMatcher": []
-                },
-                {
-                    "label": "Update Changelog",
-                    "type": "shell",
-                    "command": "python3",
-                    "args": ["codebase_summary/update_changelog.py", "add", "--summary", "${input:changelogSummary}"],
-                    "group": "build",
-                    "presentation": {
-                        "echo": True,
-                        "reveal": "always",
-                        "focus": False,
-                        "panel": "shared"
-                    },
-                    "problemMatcher": []
-                }
-            ],
-            "inputs": [
-                {
-                    "id": "sessionSummary",
-                    "description": "Session summary for handoff",
-                    "default": "Completed development session",
-                    "type": "promptString"
-                },
-                {
-                    "id": "sessionType",
-                    "description": "Session completion type",
-                    "default": "completed",
-                    "type": "pickString",
-                    "options": ["completed", "unresolved", "partial"]
-                },
-                {
-                    "id": "changelogSummary",
-                    "description": "Changelog entry summary",
-                    "default": "Updated project features",
-                    "type": "promptString"
-                }
-            ]
-        }
+# arkival/INTEGRATION_GUIDE.md for existing project integration mode
+INTEGRATION_GUIDE_TEMPLATE = """# Arkival Integration Guide
 
-        vscode_dir = self.project_root / ".vscode"
-        vscode_dir.mkdir(exist_ok=True)
+## Overview
+Arkival has been successfully integrated into your existing project without modifying any of your original files.
 
-        tasks_path = vscode_dir / "tasks.json"
-        
-        # SAFETY CHECK: Never overwrite existing VS Code tasks
-        if tasks_path.exists():
-            print("⏭️  Skipping .vscode/tasks.json - already exists (preserving existing tasks)")
-        else:
-            with open(tasks_path, 'w', encoding='utf-8') as f:
-                json.dump(vscode_tasks, f, indent=2)
-            print("🔧 Created VS Code tasks.json")
+## Project Structure
+- **Your existing files**: Unchanged and preserved
+- **Arkival files**: Located in `arkival/` directory
+- **Technology Stack Detected**: {tech_stack}
 
-    def _setup_gitpod_tasks(self):
-        """Set up Gitpod tasks in .gitpod.yml"""
-        gitpod_config = """
-tasks:
-  - name: Agent Workflow System
-    init: |
-      echo "🎯 Agent Workflow System Ready"
-      echo "Available commands:"
-      echo "- gp tasks:run 'Agent Incoming Workflow'"
-      echo "- gp tasks:run 'Agent Outgoing Workflow'"
-    command: |
-      echo "Workflow system ready. Use 'python3 codebase_summary/agent_workflow_orchestrator.py incoming' to start."
+## Using Arkival Workflows
 
-vscode:
-  extensions:
-    - ms-python.python
-    - ms-vscode.vscode-json
-"""
+### Agent Incoming Workflow
+```bash
+python3 arkival/codebase_summary/agent_workflow_orchestrator.py incoming
+```
 
-        gitpod_path = self.project_root / ".gitpod.yml"
-        
-        # SAFETY CHECK: Never overwrite existing .gitpod.yml
-        if gitpod_path.exists():
-            print("⏭️  Skipping .gitpod.yml - already exists (preserving existing Gitpod configuration)")
-        else:
-            with open(gitpod_path, 'w', encoding='utf-8') as f:
-                f.write(gitpod_config)
-            print("🔧 Created .gitpod.yml configuration")
+### Agent Outgoing Workflow  
+```bash
+python3 arkival/codebase_summary/agent_workflow_orchestrator.py outgoing --summary "Session summary" --type completed
+```
 
-    def _setup_shell_scripts(self):
-        """Set up shell scripts for generic IDE environments"""
-        scripts = {
-            "agent_incoming.sh": """#!/bin/bash
-echo "🎯 NEW AGENT ONBOARDING WORKFLOW"
-echo "================================"
-python3 codebase_summary/agent_workflow_orchestrator.py incoming
-echo ""
-echo "✅ Incoming workflow completed."
-""",
-            "agent_outgoing.sh": """#!/bin/bash
-echo "🚀 OUTGOING AGENT HANDOFF WORKFLOW"
-echo "=================================="
-if [ -z "$1" ]; then
-    echo "Usage: ./agent_outgoing.sh \"Session summary\" [completed|unresolved]"
-    echo "Example: ./agent_outgoing.sh \"Implemented new features\" completed"
-    exit 1
-fi
-SUMMARY="$1"
-TYPE="${2:-completed}"
-python3 codebase_summary/agent_workflow_orchestrator.py outgoing --summary "$SUMMARY" --type "$TYPE"
-""",
-            "update_changelog.sh": """#!/bin/bash
-if [ -z "$1" ]; then
-    echo "Usage: ./update_changelog.sh \"Change summary\""
-    echo "Example: ./update_changelog.sh \"Added new login functionality\""
-    exit 1
-fi
-python3 codebase_summary/update_changelog.py add --summary "$1"
+### Update Changelog
+```bash
+python3 arkival/codebase_summary/update_changelog.py add --summary "Change description"
+```
+
+## Configuration
+- **Arkival Config**: `arkival/workflow_config.json`
+- **Arkival Changelog**: `arkival/changelog_summary.json` 
+- **Your Original Files**: Completely preserved
+
+## Integration Notes
+- Arkival operates independently in its subdirectory
+- Your existing build processes and workflows remain unchanged
+- You can use Arkival workflows alongside your existing development process
+- No conflicts with your existing project structure
+
+## Next Steps
+1. Review `arkival/workflow_config.json` and customize if needed
+2. Test the agent workflows using the commands above
+3. Begin AI collaboration with full workflow support
+4. Your existing project development continues normally
+
+## Technology Stack Integration
+Detected in your project:
+{tech_list}
+
+Existing directories preserved:
+{dir_list}
 """
-        }
 
-        scripts_dir = self.project_root / ".workflow_system" / "scripts"
+# IDE-specific "How to run" instructions for SETUP_GUIDE.md
+VSCODE_RUN_SNIPPET = """
+**How to run**: 
+- Press `Ctrl+Shift+P` (or `Cmd+Shift+P` on Mac)
+- Type "Tasks: Run Task"
+- Select "Agent Incoming Workflow"
+
+**Or use terminal**: `python3 codebase_summary/agent_workflow_orchestrator.py incoming`
+"""
 
-        for script_name, script_content in scripts.items():
-            script_path = scripts_dir / script_name
-            
-            # SAFETY CHECK: Don't overwrite existing scripts
-            if script_path.exists():
-                print(f"⏭️  Skipping {script_name} - already exists")
-                continue
-                
-            with open(script_path, 'w', encoding='utf-8') as f:
-                f.write(script_content)
+IDE_RUN_SNIPPETS = {
+    **dict.fromkeys(VSCODE_IDES, VSCODE_RUN_SNIPPET),
+    'replit': """
+**How to run**: 
+- Click on "Agent Incoming Workflow" in the workflows panel
+- Or use the terminal: `python3 codebase_summary/agent_workflow_orchestrator.py incoming`
+"""
+}
 
-            # Make scripts executable on Unix systems
-            if platform.system() != 'Windows':
-                os.chmod(script_path, 0o755)
+DEFAULT_RUN_SNIPPET = """
+**How to run**: 
+- Terminal: `python3 codebase_summary/agent_workflow_orchestrator.py incoming`
+- Or: `./.workflow_system/scripts/agent_incoming.sh`
+"""
 
-        print("🔧 Created shell scripts for workflow execution")
+SETUP_GUIDE_TEMPLATE = """# Workflow System Setup Guide - {ide}
 
-    def _initialize_changelog(self):
-        """Initialize changelog system (existing functionality)"""
-        changelog = {
-            "_generator": "Generated by setup_workflow_system.py - Initial changelog system setup",
-            "project_name": "New Project",
-            "changelog_version": "1.0.0",
-            "last_updated": datetime.now().isoformat() + "Z",
-            "description": "Comprehensive changelog tracking all significant changes",
-            "environment": {
-                "ide": self.detected_ide,
-                "platform": platform.system(),
-                "workflow_method": self._get_workflow_method()
-            },
-            "team_workflow": {
-                "update_instructions": "When asked to 'update the changelog from the last entry', analyze the collaboration session and document completed work or unresolved issues",
-                "quick_start": f"Run: {self._get_changelog_command()}",
-                "attribution": "Author should be the team member who collaborated on the work"
-            },
-            "entries": [
-                {
-                    "id": "change_001",
-                    "timestamp": datetime.now().isoformat() + "Z",
-                    "author": "Workflow System",
-                    "version": "1.0.0",
-                    "type": "feature",
-                    "scope": "infrastructure",
-                    "summary": "Initialized cross-platform agent workflow orchestration system",
-                    "description": f"Set up complete workflow system with agent handoff, changelog management, and documentation automation for {self.detected_ide.upper()} environment",
-                    "files_changed": [
-                        {
-                            "file": "multiple",
-                            "action": "created",
-                            "changes": ["Cross-platform workflow orchestration system files"]
-                        }
-                    ],
-                    "breaking_changes": False,
-                    "migration_notes": "No migration required - initial setup",
-                    "related_issues": [],
-                    "tags": ["setup", "workflow", "infrastructure", self.detected_ide]
-                }
-            ],
-            "statistics": {
-                "total_entries": 1,
-                "entries_by_type": {"feature": 1},
-                "entries_by_scope": {"infrastructure": 1}
-            }
-        }
+## Quick Start
+1. The workflow system has been automatically configured for {ide}
+2. Test the system by running the incoming workflow
+3. Begin development with full agent handoff support
 
-        changelog_path = self.project_root / "changelog_summary.json"
-        
-        # SAFETY CHECK: Never overwrite existing changelog
-        if changelog_path.exists():
-            print("⏭️  Skipping changelog_summary.json - already exists (preserving existing changelog)")
-            return
-            
-        with open(changelog_path, 'w', encoding='utf-8') as f:
-            json.dump(changelog, f, indent=2)
+## Available Workflows
 
-        print("📝 Created changelog_summary.json")
+### Agent Incoming Workflow
+**Purpose**: Load context when starting a new session
+{run_snippet}
+### Update Changelog
+**Purpose**: Add entries to project changelog
 
-    def _get_changelog_command(self):
-        """Get appropriate changelog command for the IDE"""
-        if self.detected_ide in ['vscode', 'cursor', 'codespaces']:
-            return "Ctrl+Shift+P -> Tasks: Run Task -> Update Changelog"
-        elif self.detected_ide == 'replit':
-            return "Use 'Agent Outgoing Workflow' from workflows menu"
-        else:
-            return "./.workflow_system/scripts/update_changelog.sh 'Summary'"
+## AI Agent Integration
 
-    def _create_initial_documentation(self):
-        """Create initial project documentation (existing functionality enhanced)"""
-        codebase_summary = {
-            "project_name": "New Project",
-            "version": "1.0.0",
-            "last_updated": datetime.now().isoformat() + "Z",
-            "description": "Project with cross-platform agent workflow orchestration system",
-            "technology_stack": ["Generic"],
-            "environment": {
-                "ide": self.detected_ide,
-                "platform": platform.system(),
-                "workflow_integration": self._get_workflow_method()
-            },
-            "workflow_system": {
-                "enabled": True,
-                "version": "1.0.0",
-                "cross_platform": True,
-                "features": [
-                    "Agent handoff automation",
-                    "Changelog management",
-                    "Documentation tracking",
-                    "Cost optimization",
-                    "Cross-IDE compatibility"
-                ]
-            },
-            "statistics": {
-                "total_files": 0,
-                "documented_functions": 0,
-                "missing_breadcrumbs": []
-            }
-        }
+### After Setup - Important Next Steps:
+1. **Edit `workflow_config.json`** with your project-specific details:
+   - Update `project_name` and `technology_stack`
+   - Add `main_files` and `important_directories`
+   - Customize integration notes for your development workflow
 
-        summary_path = self.project_root / "codebase_summary" / "codebase_summary.json"
-        
-        # SAFETY CHECK: Never overwrite existing codebase summary
-        if summary_path.exists():
-            print("⏭️  Skipping codebase_summary/codebase_summary.json - already exists")
-        else:
-            with open(summary_path, 'w', encoding='utf-8') as f:
-                json.dump(codebase_summary, f, indent=2)
-            print("📊 Created codebase_summary.json")
+2. **AI Agent Onboarding Process**:
+   - The AI agent you're working with should **analyze your project structure**
+   - Ask the agent to **update workflow_config.json** with detected technology stack
+   - Request the agent to **configure project-specific settings** based on your codebase
 
-    def _handle_gitignore(self):
-        """Handle .gitignore file - merge with existing or create new"""
-        arkival_gitignore_entries = """
-# Arkival-specific entries
-# =======================
+### Example Agent Instructions:
+```
+"Analyze this project and update workflow_config.json with the correct technology stack, main files, and project-specific configuration. This is a [your-tech-stack] project with [key-features]."
+```
 
-# Generated JSON files (should not be committed)
-codebase_summary.json
-changelog_summary.json
-codebase_summary/session_state.json
-codebase_summary/agent_handoff.json
-codebase_summary/missing_breadcrumbs.json
-export_package/agent_handoff.json
+### What the AI Agent Should Configure:
+- **Technology Stack Detection** (Vite, React, Three.js, SpacetimeDB, etc.)
+- **Main Files Identification** (package.json, vite.config.ts, src/main.tsx)
+- **Important Directories** (src, public, components, etc.)
+- **Integration Notes** for your specific development workflow
 
-# Arkival data directory (subdirectory mode)
-Arkival/data/
+## IDE Integration Features
+- **Detected IDE**: {ide}
+- **Workflow Method**: {workflow_method}
+- **Task Runner**: {task_runner}
 
-# Arkival documentation (kept separate from project docs)
-arkival_docs/
+## Troubleshooting
+- Ensure Python 3.11+ is available in your terminal
+- Check that all files in `codebase_summary/` directory exist
+- Verify workflow configuration files are present
+- If workflow_config.json needs updates, ask your AI agent to analyze and configure it
 
-# IDE-specific files (generated during setup)
-.replit
-.gitpod.yml
+## Customization
+Edit `workflow_config.json` to customize the system for your project needs, or ask your AI agent to configure it based on your project structure.
+"""
 
-# Environment-specific workflow files
-.workflow_system/
+class WorkflowSystemSetup:
+    """
+    # @codebase-summary: Core workflow system setup orchestrator
+    - Manages cross-platform workflow system installation and configuration
+    - Detects IDE environment and adapts setup procedures accordingly
+    - Handles file copying, configuration, and validation
+    - Used by: project initialization, environment setup, deployment automation
+    """
+    def __init__(self):
+        import platform
 
-# System files
-codebase_summary/history/
+        self.package_root = Path(__file__).parent
+        self.deployment_context = self._detect_deployment_context()
+        self._platform = platform.system()
+        # --fast: trust a current setup stamp without re-checking or re-verifying files
+        self._fast = '--fast' in sys.argv
+        # One timestamp per run so every generated file records the same setup time
+        self._started_at = time.time()
+        self._now_iso = _utc_iso(self._started_at)
+        # Presence of project files probed by _check_files_present, reused by later checks
+        self._verified_files = {}
+        # Progress lines buffered by _info and written in one go when setup finishes or fails;
+        # steps running on worker threads queue into their own list in _step_logs
+        self._log = []
+        self._step_logs = {}
+
+    # Detection results below are computed on first access and shared by every later
+    # consumer (setup steps, simulation report). Setup is single-shot, so they are never invalidated.
+    @cached_property
+    def project_root(self):
+        return self._determine_project_root()
+
+    @cached_property
+    def detected_ide(self):
+        return self._detect_ide_environment()
+
+    @cached_property
+    def existing_architecture(self):
+        return self._scan_existing_architecture()
+
+    @cached_property
+    def _root(self):
+        return os.fspath(self.project_root)
+
+    def _p(self, *parts):
+        """Join project-relative parts onto the project root as a plain string path"""
+        return os.path.join(self._root, *parts)
 
-# Node.js files (not needed for Python project)
-package.json
-package-lock.json
-"""
+    def _detect_deployment_context(self):
+        """
+        # @codebase-summary: Deployment context detection system
+        - Detects if Arkival is being deployed as new project root or integrated into existing project
+        - Analyzes directory structure to determine deployment strategy
+        - Used by: setup automation, integration strategy, file placement decisions
+        """
+        current_dir = Path.cwd()
+        arkival_dir = self.package_root
         
-        gitignore_path = self.project_root / ".gitignore"
+        # Check if we're running from within a cloned Arkival directory
+        if current_dir.name.lower() in ['arkival', 'arkival-v4'] and current_dir.parent != current_dir:
+            # We're in /Arkival folder - this is existing project integration
+            print("🔍 Detected: Running from cloned Arkival directory")
+            return 'existing_project_integration'
+        
+        # Check if we're in the Arkival source directory (workspace)
+        if arkival_dir.name.lower() == 'workspace':
+            return 'new_project'
+        
+        # Check if parent directory has existing project structure
+        parent_dir = current_dir.parent
+        existing_indicators = [
+            'package.json', 'src/', 'app/', 'components/', 'public/', 
+            '.git/', 'node_modules/', 'requirements.txt', 'Cargo.toml',
+            'pom.xml', 'build.gradle', 'composer.json', 'README.md'
+        ]
+        
+        parent_count = sum(1 for indicator in existing_indicators 
+                          if (parent_dir / indicator).exists())
+        
+        if parent_count >= 2:
+            return 'existing_project_integration'
+        
+        return 'new_project'
+    
+    def _determine_project_root(self):
+        """
+        # @codebase-summary: Project root determination for flexible deployment
+        - Determines appropriate project root based on deployment context
+        - Handles both new project and existing project integration scenarios
+        - Used by: file placement, configuration generation, deployment strategy
+        """
+        current_dir = Path.cwd()
+        
+        # If we're in /Arkival folder, the project root is the parent directory
+        if current_dir.name.lower() in ['arkival', 'arkival-v4'] and self.deployment_context == 'existing_project_integration':
+            return current_dir.parent  # Parent directory is the actual project root
+        else:
+            return current_dir  # For new projects or source development
+    
+    def _scan_existing_architecture(self):
+        """
+        # @codebase-summary: Existing project architecture scanning system
+        - Scans for existing project files that should be preserved during integration
+        - Identifies technology stack, build tools, and workflow configurations
+        - Used by: integration strategy, conflict avoidance, selective deployment
+        """
+        if self.deployment_context == 'new_project':
+            return {}
+            
+        architecture = {
+            'technology_stack': [],
+            'existing_files': [],
+            'config_files': [],
+            'build_tools': [],
+            'important_directories': []
+        }
+        
+        # Scan for technology indicators
+        current_dir = Path.cwd()
+        
+        # Frontend frameworks and build tools
+        if (current_dir / 'package.json').exists():
+            architecture['technology_stack'].append('Node.js/npm')
+            architecture['config_files'].append('package.json')
+        
+        if (current_dir / 'vite.config.js').exists() or (current_dir / 'vite.config.ts').exists():
+            architecture['technology_stack'].append('Vite')
+        
+        if (current_dir / 'next.config.js').exists():
+            architecture['technology_stack'].append('Next.js')
+        
+        if (current_dir / 'vue.config.js').exists():
+            architecture['technology_stack'].append('Vue.js')
+        
+        # Backend frameworks
+        if (current_dir / 'requirements.txt').exists():
+            architecture['technology_stack'].append('Python')
+            architecture['config_files'].append('requirements.txt')
         
-        if gitignore_path.exists():
-            # Read existing .gitignore
-            with open(gitignore_path, 'r', encoding='utf-8') as f:
-                existing_content = f.read()
-            
-            # Check if Arkival entries already exist
-            if "Arkival-specific entries" in existing_content:
-                print("✅ .gitignore already contains Arkival entries")
-                return
-            
-            # Append Arkival entries to existing .gitignore
-            with open(gitignore_path, 'a', encoding='utf-8') as f:
-                f.write("\n" + arkival_gitignore_entries)
-            print("📝 Appended Arkival entries to existing .gitignore")
-        else:
-            # Create new .gitignore with standard entries plus Arkival entries
-            standard_gitignore = """# Dependencies
-node_modules/
-__pycache__/
-*.pyc
-*.pyo
-*.pyd
-.Python
-env/
-venv/
-.venv/
-
-# IDE
-.vscode/
-.idea/
-*.swp
-*.swo
-*~
-
-# OS
-.DS_Store
-.DS_Store?
-._*
-.Spotlight-V100
-.Trashes
-ehthumbs.db
-Thumbs.db
-
-# Build outputs
-dist/
-build/
-*.egg-info/
-
-# Environment variables
-.env
-.env.local
-
-# Logs
-logs/
-*.log
-
-# Temporary files
-*.tmp
-*.temp
-.tmp/
-temp/
-"""
+        if (current_dir / 'Cargo.toml').exists():
+            architecture['technology_stack'].append('Rust')
             
-            with open(gitignore_path, 'w', encoding='utf-8') as f:
-                f.write(standard_gitignore + arkival_gitignore_entries)
-            print("📄 Created .gitignore with Arkival entries")
-
-    def _create_community_standards_files(self):
-        """Create GitHub community standards files"""
-        # Handle .gitignore - merge with existing or create new
-        self._handle_gitignore()
-
-        # Create arkival_docs directory if not exists
-        arkival_docs_dir = self.project_root / "arkival_docs"
-        arkival_docs_dir.mkdir(parents=True, exist_ok=True)
+        if (current_dir / 'pom.xml').exists():
+            architecture['technology_stack'].append('Java/Maven')
         
-        # Create LICENSE (Attribution to Spitfire Products) in arkival_docs
-        license_content = """Attribution License
-
-Copyright (c) 2025 Spitfire Products
-
-Permission is hereby granted, free of charge, to any person obtaining a copy
-of this software and associated documentation files (the "Software"), to deal
-in the Software without restriction, including without limitation the rights
-to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
-copies of the Software, and to permit persons to whom the Software is
-furnished to do so, subject to the following conditions:
-
-The above copyright notice and this permission notice shall be included in all
-copies or substantial portions of the Software.
-
-Attribution to Spitfire Products must be maintained in all copies, substantial
-portions, derivative works, and distributions of the Software. This includes
-but is not limited to:
-- Source code headers and comments
-- Documentation and README files
-- User interfaces and about pages
-- Distribution packages and releases
-
-THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
-IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
-OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
-SOFTWARE.
-
-Original work by Spitfire Products
-Arkival - AI Agent Workflow Orchestration System
-"""
-
-        # Place Arkival LICENSE in arkival_docs folder
-        arkival_license_path = arkival_docs_dir / "ARKIVAL_LICENSE"
+        # Important directories to preserve
+        for dirname in ['src', 'app', 'components', 'public', 'assets', 'lib', 'utils', 'styles']:
+            if (current_dir / dirname).exists():
+                architecture['important_directories'].append(dirname)
         
-        if arkival_license_path.exists():
-            print("⏭️  Skipping arkival_docs/ARKIVAL_LICENSE - already exists")
-        else:
-            with open(arkival_license_path, 'w', encoding='utf-8') as f:
-                f.write(license_content)
-            print("📄 Created arkival_docs/ARKIVAL_LICENSE")
-
-        # Create CONTRIBUTING.md in arkival_docs
-        contributing_content = """# Contributing to Arkival
-
-Thank you for your interest in contributing! Arkival enables seamless knowledge transfer between AI agents and human developers across different development environments.
+        return architecture
 
-## Getting Started
+    def _detect_ide_environment(self):
+        """Detect the current IDE/development environment"""
+        # Check for various IDE indicators in priority order
+        env = os.environ
+        root = str(self.project_root)
+        for kind, key, ide in IDE_MARKERS:
+            if kind == 'env':
+                if env.get(key):
+                    return ide
+            elif os.path.isdir(os.path.join(root, key)):
+                return ide
+        return 'generic'
 
-1. Fork the repository
-2. Clone your fork locally
-3. Run the setup script: `python3 setup_workflow_system.py`
-4. Test your changes with: `python3 validate_deployment.py`
+    def setup_new_project(self):
+        """
+        # @codebase-summary: New project setup for Arkival workflow system
+        - Sets up complete workflow system for new project deployment
+        - Creates all necessary files, directories, and configurations
+        - Used by: new project initialization, clean deployment scenarios
+        """
+        print("🚀 SETTING UP NEW PROJECT WITH ARKIVAL WORKFLOW SYSTEM")
+        print("=" * 70)
+        print(f"📍 Detected environment: {self.detected_ide.upper()}")
 
-## Development Process
+        try:
+            # Step 0: Fail fast before any write if the project root is unusable
+            self._preflight()
 
-### Setting up the Development Environment
+            fingerprint = self._setup_fingerprint()
+            already_configured = self._is_already_configured(fingerprint)
+            if already_configured:
+                self._info(f"✅ Already configured - skipping setup steps (delete {SETUP_STAMP_PATH} to force a full run)")
+            else:
+                # Step 1: Create directory structure
+                self._create_directory_structure()
+
+                # Steps 2-4, 6 and 7 write disjoint files, so they run concurrently:
+                # core files, project configuration, changelog, initial documentation, community standards
+                self._run_steps_concurrently([
+                    self._copy_core_files,
+                    self._initialize_project_config,
+                    self._initialize_changelog,
+                    self._create_initial_documentation,
+                    self._create_community_standards_files
+                ])
+
+                # Step 5: Configure IDE-specific workflows
+                self._setup_ide_workflows()
+
+                # Step 8: Set up IDE integration files
+                self._setup_ide_integration()
+
+            # Step 9: Run initial system check (--fast trusts a current setup stamp instead)
+            if already_configured and self._fast:
+                self._info("⚡ --fast: setup stamp is current, skipping system verification")
+            elif self._run_system_verification():
+                _atomic_write(self._p(SETUP_STAMP_PATH), json.dumps({"setup_hash": fingerprint}))
+
+            self._info("\n✅ ARKIVAL WORKFLOW SYSTEM SETUP COMPLETED!")
+            self._info("=" * 70)
+            self._info("Next steps:")
+            self._info("1. Edit workflow_config.json with your project details")
+            self._info("2. Review IDE-specific setup instructions in SETUP_GUIDE.md")
+            self._info("3. Say 'Hi' to test the incoming agent workflow")
+            self._info("4. Begin development with full workflow support")
+            self._flush_log()
 
-```bash
-# Clone the repository
-git clone https://github.com/Spitfire-Products/Arkival-V4.git
-cd arkival
+        except Exception as e:
+            # Emit whatever progress was queued before the failure so the log stays in order
+            self._flush_log()
+            print(f"❌ Setup failed: {e}")
+            sys.exit(1)
+        finally:
+            # KeyboardInterrupt and other BaseExceptions bypass the handler above - still show
+            # the progress of the steps that did run
+            self._flush_log()
 
-# Run the setup
-python3 setup_workflow_system.py
+    def setup_existing_project_integration(self):
+        """
+        # @codebase-summary: Existing project integration for Arkival workflow system
+        - Integrates Arkival into existing projects without overwriting files
+        - Places Arkival files in arkival/ subdirectory to avoid conflicts
+        - Preserves existing project structure and workflows
+        - Used by: existing project integration, non-destructive deployment
+        """
+        print("🔧 INTEGRATING ARKIVAL INTO EXISTING PROJECT")
+        print("=" * 70)
+        print(f"📍 Detected environment: {self.detected_ide.upper()}")
+        print(f"🏗️ Existing architecture: {', '.join(self.existing_architecture.get('technology_stack', ['Unknown']))}")
 
-# Validate the setup
-python3 validate_deployment.py
-```
+        try:
+            # Step 1: Create arkival_config.json trigger file in parent
+            self._create_arkival_config()
+            
+            print("✅ Arkival integration completed - no files copied, everything stays in Arkival-V4/")
 
-### Making Changes
+            print("\n✅ ARKIVAL INTEGRATION COMPLETED!")
+            print("=" * 70)
+            print("Integration summary:")
+            print("• Only arkival_config.json added to parent directory")
+            print("• All Arkival files remain in Arkival-V4/ directory")
+            print("• Run workflows from: python3 Arkival-V4/codebase_summary/agent_workflow_orchestrator.py")
+            print("• Everything self-contained in Arkival-V4/")
 
-1. Create a feature branch: `git checkout -b feature/your-feature-name`
-2. Make your changes
-3. Add tests for new functionality
-4. Validate the setup: `python3 validate_deployment.py`
-5. Update documentation as needed
-6. Commit your changes with clear messages
+        except Exception as e:
+            print(f"❌ Integration failed: {e}")
+            sys.exit(1)
 
-### Code Style
+    def _create_arkival_subdirectory(self):
+        """
+        # @codebase-summary: Arkival subdirectory creation for existing project integration
+        - Creates arkival/ subdirectory structure for non-destructive integration
+        - Preserves existing project structure while adding Arkival capabilities
+        - Used by: existing project integration, conflict-free deployment
+        """
+        arkival_base = self.project_root / "arkival"
+        
+        directories = [
+            "arkival/codebase_summary",
+            "arkival/codebase_summary/history", 
+            "arkival/.workflow_system",
+            "arkival/.workflow_system/scripts",
+            "arkival/.workflow_system/ide_configs"
+        ]
 
-- Follow PEP 8 for Python code
-- Use meaningful variable and function names
-- Add docstrings for all functions and classes
-- Include breadcrumb documentation using `@codebase-summary:` format
+        for directory in directories:
+            dir_path = self.project_root / directory
+            try:
+                dir_path.mkdir(parents=True, exist_ok=True)
+                print(f"📁 Created: {directory}")
+            except Exception as e:
+                print(f"❌ Failed to create {directory}: {e}")
 
-### Testing
+    def _copy_arkival_files(self):
+        """
+        # @codebase-summary: Arkival file copying for existing project integration
+        - Copies Arkival system files to arkival/ subdirectory
+        - Avoids overwriting existing project files
+        - Used by: existing project integration, selective file deployment
+        """
+        import shutil
 
-- Write tests for new features
-- Ensure all tests pass before submitting
-- Test across different IDE environments when possible
+        core_files = [
+            ("codebase_summary/agent_workflow_orchestrator.py", "arkival/codebase_summary/agent_workflow_orchestrator.py"),
+            ("codebase_summary/update_changelog.py", "arkival/codebase_summary/update_changelog.py"),
+            ("codebase_summary/update_project_summary.py", "arkival/codebase_summary/update_project_summary.py"),
+            ("NEW_AGENT_GREETING.md", "arkival/NEW_AGENT_GREETING.md"),
+            ("DEVELOPER_ONBOARDING.md", "arkival/DEVELOPER_ONBOARDING.md"),
+            ("AGENT_GUIDE.md", "arkival/AGENT_GUIDE.md")
+        ]
 
-### Documentation
+        for source, dest in core_files:
+            source_path = self.package_root / source
+            dest_path = self.project_root / dest
 
-- Update README.md if needed
-- Add or update docstrings
-- Include examples for new features
-- Update CHANGELOG.md following semantic versioning
+            if source_path.exists():
+                try:
+                    # Ensure destination directory exists
+                    dest_path.parent.mkdir(parents=True, exist_ok=True)
+                    
+                    # SAFETY CHECK: Never overwrite existing files
+                    if dest_path.exists():
+                        print(f"⏭️  Skipping {dest} - already exists (preserving existing file)")
+                        continue
+                    
+                    shutil.copy2(source_path, dest_path)
+                    print(f"📄 Copied to arkival/: {dest.replace('arkival/', '')}")
+                except Exception as e:
+                    print(f"❌ Failed to copy {dest}: {e}")
+            else:
+                print(f"⚠️  Source file not found: {source}")
 
-## Submitting Changes
+    def _create_integration_config(self):
+        """
+        # @codebase-summary: Integration-specific configuration generation
+        - Creates Arkival configuration that works with existing project
+        - Includes detected technology stack and existing architecture info
+        - Used by: existing project integration, context-aware configuration
+        """
+        config = {
+            "_generator": "Generated by setup_workflow_system.py - Arkival integration for existing project",
+            "deployment_mode": "existing_project_integration",
+            "project_name": f"Existing Project + Arkival",
+            "project_description": f"Existing {', '.join(self.existing_architecture.get('technology_stack', ['Unknown']))} project with Arkival workflow integration",
+            "version": "1.0.0",
+            "technology_stack": self.existing_architecture.get('technology_stack', ['Unknown']),
+            "existing_architecture": self.existing_architecture,
+            "environment": {
+                "detected_ide": self.detected_ide,
+                "platform": self._platform,
+                "supports_integrated_terminal": True,
+                "supports_tasks": self.detected_ide in VSCODE_IDES
+            },
+            "workflow_settings": {
+                "auto_changelog": True,
+                "auto_documentation": True,
+                "cost_optimization": True,
+                "agent_handoff_enabled": True,
+                "ide_integration": True,
+                "arkival_subdirectory": True
+            },
+            "integration_notes": {
+                "arkival_location": "arkival/",
+                "original_project_preserved": True,
+                "workflow_commands": "Run from arkival/ subdirectory",
+                "configuration_file": "arkival/workflow_config.json"
+            },
+            "setup_timestamp": self._now_iso
+        }
 
-1. Push your branch to your fork
-2. Submit a pull request
-3. Describe your changes clearly
-4. Link any related issues
+        config_path = self.project_root / "arkival" / "workflow_config.json"
+        try:
+            # Ensure parent directory exists
+            config_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            # SAFETY CHECK: Even in arkival subdirectory, don't overwrite
+            if config_path.exists():
+                print(f"⏭️  Skipping arkival/workflow_config.json - already exists")
+                return
+                
+            config_path.write_bytes(_dumps_json(config))
+            print(f"⚙️  Created arkival/workflow_config.json")
+        except Exception as e:
+            print(f"❌ Failed to create integration config: {e}")
+    
+    def _create_arkival_config(self):
+        """Create arkival_config.json trigger file in project root"""
+        try:
+            # Detect the actual Arkival directory name
+            current_dir = Path.cwd()
+            arkival_dir_name = current_dir.name if current_dir.name.lower() in ['arkival', 'arkival-v4'] else 'Arkival-V4'
+            
+            # Simple trigger file for subdirectory mode detection
+            config = {
+                "arkival_integration": True,
+                "version": "4.0",
+                "deployment_mode": "subdirectory",
+                "arkival_directory": arkival_dir_name,
+                "created_at": self._now_iso,
+                "note": "This file enables Arkival subdirectory mode detection"
+            }
+            
+            config_path = self.project_root / "arkival_config.json"
+            
+            # SAFETY CHECK: Don't overwrite existing config
+            if config_path.exists():
+                print("⏭️  Skipping arkival_config.json - already exists")
+                return
+            
+            config_path.write_bytes(_dumps_json(config))
+            print("⚙️  Created arkival_config.json (enables subdirectory mode)")
+            
+        except Exception as e:
+            print(f"❌ Failed to create arkival_config.json: {e}")
+            
+        # Migrate .scanignore to parent root for subdirectory deployments
+        self._migrate_scanignore_to_parent()
 
-## Code of Conduct
+    def _migrate_scanignore_to_parent(self):
+        """Migrate .scanignore to parent project root in subdirectory mode"""
+        try:
+            source_scanignore = self.package_root / ".scanignore"
+            target_scanignore = self.project_root / ".scanignore"
+            
+            if not source_scanignore.exists():
+                print("⚠️  No .scanignore found in Arkival directory")
+                return
+                
+            if target_scanignore.exists():
+                print("⏭️  Skipping .scanignore migration - already exists in parent")
+                return
+                
+            # Copy .scanignore to parent project root
+            import shutil
+            shutil.copy2(source_scanignore, target_scanignore)
+            print("⚙️  Migrated .scanignore to parent project root")
+            
+        except Exception as e:
+            print(f"❌ Failed to migrate .scanignore: {e}")
 
-- Be respectful and inclusive
-- Focus on constructive feedback
-- Help maintain a welcoming environment for all contributors
+    def _initialize_arkival_changelog(self):
+        """
+        # @codebase-summary: Arkival-specific changelog initialization for integration
+        - Creates changelog in arkival/ subdirectory for integration tracking
+        - Preserves existing project changelog if present
+        - Used by: existing project integration, change tracking isolation
+        """
+        changelog = {
+            "_generator": "Generated by setup_workflow_system.py - Arkival integration changelog",
+            "project_name": f"Arkival Integration",
+            "changelog_version": "1.0.0",
+            "last_updated": self._now_iso,
+            "description": "Arkival workflow system integration tracking",
+            "integration_mode": True,
+            "entries": [
+                {
+                    "id": "integration_001",
+                    "timestamp": self._now_iso,
+                    "author": "Arkival Setup",
+                    "version": "1.0.0",
+                    "type": "feature",
+                    "scope": "integration",
+                    "summary": "Integrated Arkival workflow system into existing project",
+                    "description": f"Added Arkival workflow capabilities to existing {', '.join(self.existing_architecture.get('technology_stack', ['Unknown']))} project without modifying original files",
+                    "files_changed": [
+                        {
+                            "file": "arkival/",
+                            "action": "created",
+                            "changes": ["Arkival workflow system integration"]
+                        }
+                    ],
+                    "breaking_changes": False,
+                    "migration_notes": "No migration required - integration preserves existing structure",
+                    "related_issues": [],
+                    "tags": ["arkival", "integration", "workflow"]
+                }
+            ]
+        }
 
-## Questions?
+        changelog_path = self.project_root / "arkival" / "changelog_summary.json"
+        try:
+            # Ensure parent directory exists
+            changelog_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            # SAFETY CHECK: Even in arkival subdirectory, don't overwrite
+            if changelog_path.exists():
+                print("⏭️  Skipping arkival/changelog_summary.json - already exists")
+                return
+                
+            changelog_path.write_bytes(_dumps_json(changelog))
+            print("📝 Created arkival/changelog_summary.json")
+        except Exception as e:
+            print(f"❌ Failed to create arkival changelog: {e}")
 
-- Open an issue for bugs or feature requests
-- Start a discussion for general questions
-- Check existing issues before creating new ones
+    def _create_integration_documentation(self):
+        """
+        # @codebase-summary: Integration documentation generation
+        - Creates documentation specific to Arkival integration mode
+        - Provides usage instructions for existing project context
+        - Used by: existing project integration, user guidance
+        """
+        tech_stack = self.existing_architecture.get('technology_stack', ['Unknown'])
+        integration_guide = INTEGRATION_GUIDE_TEMPLATE.format(
+            tech_stack=', '.join(tech_stack),
+            tech_list="\n".join(f'- {tech}' for tech in tech_stack),
+            dir_list="\n".join(f'- {dir_name}/' for dir_name in self.existing_architecture.get('important_directories', []))
+        )
 
-Thank you for contributing to making AI agent workflows more efficient!
-"""
+        guide_path = self.project_root / "arkival" / "INTEGRATION_GUIDE.md"
+        try:
+            # Ensure parent directory exists  
+            guide_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            # SAFETY CHECK: Even in arkival subdirectory, don't overwrite
+            if guide_path.exists():
+                print("⏭️  Skipping arkival/INTEGRATION_GUIDE.md - already exists")
+            else:
+                guide_path.write_text(integration_guide, encoding='utf-8')
+                print("📖 Created arkival/INTEGRATION_GUIDE.md")
+        except Exception as e:
+            print(f"❌ Failed to create integration guide: {e}")
 
-        # Place CONTRIBUTING.md in arkival_docs folder
-        arkival_contributing_path = arkival_docs_dir / "ARKIVAL_CONTRIBUTING.md"
+    def _validate_integration(self):
+        """
+        # @codebase-summary: Integration validation and verification system
+        - Validates that Arkival integration completed successfully
+        - Checks for required files and proper directory structure
+        - Used by: existing project integration, deployment verification
+        """
+        print(f"\n🔍 VALIDATING ARKIVAL INTEGRATION...")
         
-        if arkival_contributing_path.exists():
-            print("⏭️  Skipping arkival_docs/ARKIVAL_CONTRIBUTING.md - already exists")
+        required_arkival_files = [
+            "arkival/codebase_summary/agent_workflow_orchestrator.py",
+            "arkival/codebase_summary/update_changelog.py", 
+            "arkival/workflow_config.json",
+            "arkival/changelog_summary.json",
+            "arkival/INTEGRATION_GUIDE.md"
+        ]
+        
+        all_good = True
+        for file_path in required_arkival_files:
+            full_path = self.project_root / file_path
+            if full_path.exists():
+                print(f"✅ {file_path}")
+            else:
+                print(f"❌ {file_path} - MISSING")
+                all_good = False
+                
+        if all_good:
+            print("✅ Arkival integration completed successfully")
+            print("🎯 Your existing project files remain unchanged")
         else:
-            with open(arkival_contributing_path, 'w', encoding='utf-8') as f:
-                f.write(contributing_content)
-            print("📄 Created arkival_docs/ARKIVAL_CONTRIBUTING.md")
+            print("❌ Some Arkival files missing - integration may be incomplete")
 
-        # Create SECURITY.md
-        security_content = """# Security Policy
+    def _preflight(self):
+        """
+        # @codebase-summary: Project root preflight validation
+        - Verifies the project root is an existing, writable directory before setup writes anything
+        - Rejects target directories that are files or symlinks pointing outside the project root
+        - Used by: new project setup, to avoid leaving half-finished setup residue behind
+        """
+        root = self.project_root
+        if not root.is_dir():
+            raise SetupError(f"Project root {root} does not exist or is not a directory")
+        if not os.access(root, os.W_OK):
+            raise SetupError(f"Project root {root} is not writable")
+
+        resolved_root = root.resolve()
+        for directory in PREFLIGHT_DIRECTORIES:
+            dir_path = root / directory
+            if dir_path.is_symlink() and not dir_path.resolve().is_relative_to(resolved_root):
+                raise SetupError(f"{directory} is a symlink pointing outside the project root ({dir_path.resolve()})")
+            if dir_path.exists() and not dir_path.is_dir():
+                raise SetupError(f"{directory} exists but is not a directory")
+
+    def _run_steps_concurrently(self, steps):
+        """Run independent setup steps on a thread pool, then queue each step's progress lines in list order"""
+        def run_step(step):
+            # _info calls from this worker land in the step's own list instead of the shared log
+            step_log = self._step_logs[threading.get_ident()] = []
+            try:
+                step()
+                return step_log, None
+            except Exception as e:
+                return step_log, e
+            finally:
+                del self._step_logs[threading.get_ident()]
 
-## Supported Versions
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(run_step, steps))
 
-We release patches for security vulnerabilities for the following versions:
+        for step_log, _ in results:
+            self._log.extend(step_log)
+        for _, error in results:
+            if error is not None:
+                raise error
 
-| Version | Supported          |
-| ------- | ------------------ |
-| 1.0.x   | :white_check_mark: |
-| < 1.0   | :x:                |
+    def _setup_fingerprint(self):
+        """Hash the inputs that decide what setup writes: detected IDE and core source file stats"""
+        import hashlib
 
-## Reporting a Vulnerability
+        stats = []
+        for source, _ in CORE_FILES:
+            try:
+                st = os.stat(self.package_root / source)
+                stats.append((source, st.st_mtime_ns, st.st_size))
+            except OSError:
+                stats.append((source, None, None))
+        return hashlib.sha256(repr((self.detected_ide, tuple(stats))).encode('utf-8')).hexdigest()
+
+    def _is_already_configured(self, fingerprint):
+        """Check for a setup stamp that matches the fingerprint, postdates this script and still has every output"""
+        stamp_path = self._p(SETUP_STAMP_PATH)
+        try:
+            with open(stamp_path, 'rb') as f:
+                stamp = json.loads(f.read())
+            stamp_mtime = os.stat(stamp_path).st_mtime_ns
+            script_mtime = os.stat(__file__).st_mtime_ns
+        except (OSError, ValueError):
+            return False
+
+        if stamp.get("setup_hash") != fingerprint or stamp_mtime < script_mtime:
+            return False
+        if self._fast:
+            return True
+
+        # Any setup output removed since the last run must be recreated, so fall back to a full setup
+        outputs = SETUP_OUTPUT_FILES + IDE_OUTPUT_FILES.get(self.detected_ide, ())
+        if all(self._check_files_present(outputs).values()):
+            return True
+        self._verified_files.clear()
+        return False
 
-We take security vulnerabilities in Arkival seriously.
+    def _create_directory_structure(self):
+        """Create necessary directory structure"""
+        # Leaf directories only - makedirs creates codebase_summary and .workflow_system on the way
+        directories = [
+            "codebase_summary/history",
+            ".workflow_system/scripts",
+            ".workflow_system/ide_configs"
+        ]
 
-### How to Report
+        root = str(self.project_root)
+        for directory in directories:
+            try:
+                os.makedirs(os.path.join(root, directory), exist_ok=True)
+                self._info(f"📁 Created directory: {directory}")
+            except Exception as e:
+                self._info(f"❌ Failed to create {directory}: {e}")
 
-**Please do not report security vulnerabilities through public GitHub issues.**
+    def _copy_core_files(self):
+        """Copy core system files to project"""
+        core_files = CORE_FILES
 
-Instead, please send a report to the maintainers privately. Include:
+        # Resolve both roots once; per-file paths are plain string joins under them
+        src_root = os.path.realpath(self.package_root)
+        dst_root = os.path.realpath(self.project_root)
+        package_files = self._index_package(src_root, [source for source, _ in core_files])
+        for source, dest in core_files:
+            source_path = os.path.join(src_root, source)
+            dest_path = os.path.join(dst_root, dest)
 
-- Type of issue (e.g. buffer overflow, SQL injection, cross-site scripting)
-- Full paths of source file(s) related to the manifestation of the issue
-- The location of the affected source code (tag/branch/commit or direct URL)
-- Any special configuration required to reproduce the issue
-- Step-by-step instructions to reproduce the issue
-- Proof-of-concept or exploit code (if possible)
-- Impact of the issue, including how an attacker might exploit the issue
+            # Skip if source and destination are the same file
+            if source_path == dest_path:
+                self._info(f"✅ Already exists: {dest}")
+                continue
 
-### Response Timeline
+            if source in package_files:
+                try:
+                    # Ensure destination directory exists
+                    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+                    
+                    # SAFETY CHECK: Never overwrite existing files - the copy uses exclusive create
+                    if not _fastcopy(source_path, dest_path):
+                        self._info(f"⏭️  Skipping {dest} - already exists (preserving existing file)")
+                        continue
+                    
+                    self._info(f"📄 Copied: {dest}")
+                except Exception as e:
+                    self._info(f"❌ Failed to copy {dest}: {e}")
+            else:
+                self._info(f"⚠️  Source file not found: {source}")
+
+    def _index_package(self, src_root, rel_paths):
+        """Return the package-relative files that exist, using one directory listing per parent"""
+        listings = {}
+        present = set()
+        for rel_path in rel_paths:
+            parent, _, name = rel_path.rpartition('/')
+            if parent not in listings:
+                try:
+                    with os.scandir(os.path.join(src_root, parent)) as entries:
+                        listings[parent] = {entry.name for entry in entries if entry.is_file()}
+                except OSError:
+                    listings[parent] = set()
+            if name in listings[parent]:
+                present.add(rel_path)
+        return present
+
+    def _initialize_project_config(self):
+        """Initialize project configuration with IDE detection"""
+        ide = self.detected_ide
+        config = {
+            "_generator": "Generated by setup_workflow_system.py - Cross-platform workflow system setup",
+            "project_name": "New Project",
+            "project_description": "AI-powered application with workflow orchestration",
+            "version": "1.0.0",
+            "technology_stack": ["Generic"],
+            "environment": {
+                "detected_ide": ide,
+                "platform": self._platform,
+                "supports_integrated_terminal": True,
+                "supports_tasks": ide in VSCODE_IDES
+            },
+            "workflow_settings": {
+                "auto_changelog": True,
+                "auto_documentation": True,
+                "cost_optimization": True,
+                "agent_handoff_enabled": True,
+                "ide_integration": True
+            },
+            "customization": {
+                "greeting_triggers": ["hi", "hello", "hey"],
+                "changelog_triggers": ["update the changelog", "update changelog"],
+                "documentation_required": True,
+                "terminal_commands": True
+            },
+            "ide_specific": {
+                "workflow_method": self._get_workflow_method(),
+                "terminal_integration": True,
+                "task_runner": self._get_task_runner(),
+                "extensions_recommended": self._get_recommended_extensions()
+            },
+            "setup_timestamp": self._now_iso
+        }
 
-- We will acknowledge receipt of your vulnerability report within 48 hours
-- We will provide a detailed response within 7 days indicating next steps
-- We will work on a fix and coordinate disclosure timeline with you
+        try:
+            # SAFETY CHECK: Never overwrite existing config - exclusive create skips an existing file
+            if not self._create_file(self._p("workflow_config.json"), _dumps_json(config)):
+                self._info(f"⏭️  Skipping workflow_config.json - already exists (preserving existing configuration)")
+                return
+            
+            self._info(f"⚙️  Created workflow_config.json for {ide}")
+        except Exception as e:
+            self._info(f"❌ Failed to create workflow_config.json: {e}")
 
-### Security Best Practices
+    def _get_workflow_method(self):
+        """Get the workflow method based on IDE"""
+        return WORKFLOW_METHODS.get(self.detected_ide, 'shell_scripts')
 
-When using this system:
+    def _get_task_runner(self):
+        """Get recommended task runner for IDE"""
+        return TASK_RUNNERS.get(self.detected_ide, 'shell_scripts')
 
-1. **API Keys**: Never commit API keys or sensitive credentials to version control
-2. **Environment Variables**: Use environment variables for sensitive configuration
-3. **File Permissions**: Ensure proper file permissions on system files
-4. **Updates**: Keep the system updated to the latest version
-5. **Validation**: Validate all inputs and outputs in your workflows
+    def _get_recommended_extensions(self):
+        """Get recommended extensions for IDE"""
+        if self.detected_ide in VSCODE_IDES:
+            return RECOMMENDED_VSCODE_EXTENSIONS
+        return ()
 
-### Safe Usage Guidelines
+    def _write_if_absent(self, rel_path, content, *, label, executable=False):
+        """
+        # @codebase-summary: Non-destructive file writer shared by all setup steps
+        - Writes generated content relative to the project root unless the file already exists
+        - Creates shell scripts with their executable mode on Unix systems
+        - Used by: IDE workflow setup, changelog initialization, initial documentation
+        """
+        # SAFETY CHECK: Never overwrite existing files
+        if not self._create_file(self._p(rel_path), content, executable=executable):
+            self._info(f"⏭️  Skipping {rel_path} - already exists (preserving existing file)")
+            return False
 
-- Run the system in isolated environments when possible
-- Regularly update dependencies
-- Monitor system logs for unusual activity
-- Use the built-in validation features
-- Follow the principle of least privilege
+        if label:
+            self._info(label)
+        return True
 
-Thank you for helping keep Arkival secure!
-"""
+    def _info(self, msg):
+        """Queue a progress line for the next _flush_log"""
+        self._step_logs.get(threading.get_ident(), self._log).append(msg)
+
+    def _flush_log(self):
+        """Write all queued progress lines with a single stdout write"""
+        if self._log:
+            sys.stdout.write("\n".join(self._log) + "\n")
+            sys.stdout.flush()
+            self._log.clear()
+
+    def _create_file(self, path, content, executable=False):
+        """Create a new file with content (bytes, str or a render callable), returning False if it already exists"""
+        path = os.fspath(path)
+        if callable(content):
+            # Only render content for paths that are still free
+            if os.path.lexists(path):
+                return False
+            content = content()
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+
+        # The complete file is written under a temporary name and hard-linked into place: link() fails
+        # with EEXIST instead of overwriting, and a crash leaves at most a stray temp file, never a
+        # partial file that later runs would preserve
+        executable = executable and self._platform != 'Windows'
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            self._write_new(tmp_path, content, executable, os.O_TRUNC)
+            try:
+                os.link(tmp_path, path)
+            except FileExistsError:
+                return False
+            except OSError:
+                # Filesystem without hard links: fall back to a plain exclusive create
+                try:
+                    self._write_new(path, content, executable, os.O_EXCL)
+                except FileExistsError:
+                    return False
+            return True
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp_path)
+
+    @staticmethod
+    def _write_new(path, content, executable, mode_flag):
+        """Open path with O_CREAT plus mode_flag and write content, pinning 0o755 for executables"""
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | mode_flag, 0o755 if executable else 0o666)
+        with os.fdopen(fd, 'wb') as f:
+            if executable:
+                # fchmod on the open descriptor pins 0o755 regardless of umask without a second path lookup
+                os.fchmod(f.fileno(), 0o755)
+            f.write(content)
 
-        # Place SECURITY.md in arkival_docs folder
-        arkival_security_path = arkival_docs_dir / "ARKIVAL_SECURITY.md"
+    def _setup_ide_workflows(self):
+        """Set up IDE-specific workflow configurations"""
+        # Always create shell scripts as fallback
+        self._setup_shell_scripts()
         
-        if arkival_security_path.exists():
-            print("⏭️  Skipping arkival_docs/ARKIVAL_SECURITY.md - already exists")
-        else:
-            with open(arkival_security_path, 'w', encoding='utf-8') as f:
-                f.write(security_content)
-            print("📄 Created arkival_docs/ARKIVAL_SECURITY.md")
+        # Then create IDE-specific configurations
+        ide = self.detected_ide
+        if ide == 'replit':
+            self._setup_replit_workflows()
+        elif ide in VSCODE_IDES:
+            self._setup_vscode_tasks()
+        elif ide == 'gitpod':
+            self._setup_gitpod_tasks()
 
-        # Summary message handled by individual file creation
+    def _setup_replit_workflows(self):
+        """Set up Replit workflows with proper .replit file integration"""
+        # Create .replit file with workflow integration
+        self._write_if_absent(".replit", REPLIT_FILE_CONFIG,
+                              label="🔧 Created Replit .replit file with integrated workflows")
 
-    def _setup_ide_integration(self):
-        """Set up IDE-specific integration files"""
-        # Create setup guide
-        setup_guide = self._generate_setup_guide()
-        guide_path = self.project_root / "SETUP_GUIDE.md"
-        
-        # SAFETY CHECK: Never overwrite existing SETUP_GUIDE.md
-        if guide_path.exists():
-            print("⏭️  Skipping SETUP_GUIDE.md - already exists (preserving existing file)")
-        else:
-            with open(guide_path, 'w', encoding='utf-8') as f:
-                f.write(setup_guide)
-            print(f"📖 Created setup guide for {self.detected_ide.upper()}")
+        # Also create backup in .workflow_system for reference
+        self._write_if_absent(".workflow_system/replit_workflows.toml", REPLIT_WORKFLOWS_CONFIG,
+                              label="🔧 Created Replit workflow configuration backup")
 
-        # Create IDE-specific settings if applicable
-        if self.detected_ide in ['vscode', 'cursor', 'codespaces']:
-            self._create_vscode_settings()
+    def _setup_vscode_tasks(self):
+        """Set up VS Code tasks.json"""
+        os.makedirs(self._p(".vscode"), exist_ok=True)
+        self._write_if_absent(".vscode/tasks.json", VSCODE_TASKS_JSON,
+                              label="🔧 Created VS Code tasks.json")
 
-    def _generate_setup_guide(self):
-        """Generate IDE-specific setup guide"""
-        base_guide = f"""# Workflow System Setup Guide - {self.detected_ide.upper()}
+    def _setup_gitpod_tasks(self):
+        """Set up Gitpod tasks in .gitpod.yml"""
+        self._write_if_absent(".gitpod.yml", GITPOD_CONFIG,
+                              label="🔧 Created .gitpod.yml configuration")
 
-## Quick Start
-1. The workflow system has been automatically configured for {self.detected_ide.upper()}
-2. Test the system by running the incoming workflow
-3. Begin development with full agent handoff support
+    def _setup_shell_scripts(self):
+        """Set up shell scripts for generic IDE environments"""
+        created = [
+            self._write_if_absent(f".workflow_system/scripts/{script_name}", script_content,
+                                  label=None, executable=True)
+            for script_name, script_content in SHELL_SCRIPTS.items()
+        ]
 
-## Available Workflows
+        if any(created):
+            self._info("🔧 Created shell scripts for workflow execution")
 
-### Agent Incoming Workflow
-**Purpose**: Load context when starting a new session
-"""
+    def _initialize_changelog(self):
+        """Initialize changelog system (existing functionality)"""
+        ide = self.detected_ide
+        changelog = {
+            "_generator": "Generated by setup_workflow_system.py - Initial changelog system setup",
+            "project_name": "New Project",
+            "changelog_version": "1.0.0",
+            "last_updated": self._now_iso,
+            "description": "Comprehensive changelog tracking all significant changes",
+            "environment": {
+                "ide": ide,
+                "platform": self._platform,
+                "workflow_method": self._get_workflow_method()
+            },
+            "team_workflow": {
+                "update_instructions": "When asked to 'update the changelog from the last entry', analyze the collaboration session and document completed work or unresolved issues",
+                "quick_start": f"Run: {self._get_changelog_command()}",
+                "attribution": "Author should be the team member who collaborated on the work"
+            },
+            "entries": [
+                {
+                    "id": "change_001",
+                    "timestamp": self._now_iso,
+                    "author": "Workflow System",
+                    "version": "1.0.0",
+                    "type": "feature",
+                    "scope": "infrastructure",
+                    "summary": "Initialized cross-platform agent workflow orchestration system",
+                    "description": f"Set up complete workflow system with agent handoff, changelog management, and documentation automation for {ide.upper()} environment",
+                    "files_changed": [
+                        {
+                            "file": "multiple",
+                            "action": "created",
+                            "changes": ["Cross-platform workflow orchestration system files"]
+                        }
+                    ],
+                    "breaking_changes": False,
+                    "migration_notes": "No migration required - initial setup",
+                    "related_issues": [],
+                    "tags": ["setup", "workflow", "infrastructure", ide]
+                }
+            ],
+            "statistics": {
+                "total_entries": 1,
+                "entries_by_type": {"feature": 1},
+                "entries_by_scope": {"infrastructure": 1}
+            }
+        }
 
-        if self.detected_ide in ['vscode', 'cursor', 'codespaces']:
-            base_guide += """
-**How to run**: 
-- Press `Ctrl+Shift+P` (or `Cmd+Shift+P` on Mac)
-- Type "Tasks: Run Task"
-- Select "Agent Incoming Workflow"
+        self._write_if_absent("changelog_summary.json", _dumps_json(changelog),
+                              label="📝 Created changelog_summary.json")
 
-**Or use terminal**: `python3 codebase_summary/agent_workflow_orchestrator.py incoming`
-"""
-        elif self.detected_ide == 'replit':
-            base_guide += """
-**How to run**: 
-- Click on "Agent Incoming Workflow" in the workflows panel
-- Or use the terminal: `python3 codebase_summary/agent_workflow_orchestrator.py incoming`
-"""
+    def _get_changelog_command(self):
+        """Get appropriate changelog command for the IDE"""
+        ide = self.detected_ide
+        if ide in VSCODE_IDES:
+            return "Ctrl+Shift+P -> Tasks: Run Task -> Update Changelog"
+        elif ide == 'replit':
+            return "Use 'Agent Outgoing Workflow' from workflows menu"
         else:
-            base_guide += """
-**How to run**: 
-- Terminal: `python3 codebase_summary/agent_workflow_orchestrator.py incoming`
-- Or: `./.workflow_system/scripts/agent_incoming.sh`
-"""
-
-        base_guide += f"""
-### Update Changelog
-**Purpose**: Add entries to project changelog
+            return "./.workflow_system/scripts/update_changelog.sh 'Summary'"
 
-## AI Agent Integration
+    def _create_initial_documentation(self):
+        """Create initial project documentation (existing functionality enhanced)"""
+        codebase_summary = {
+            "project_name": "New Project",
+            "version": "1.0.0",
+            "last_updated": self._now_iso,
+            "description": "Project with cross-platform agent workflow orchestration system",
+            "technology_stack": ["Generic"],
+            "environment": {
+                "ide": self.detected_ide,
+                "platform": self._platform,
+                "workflow_integration": self._get_workflow_method()
+            },
+            "workflow_system": {
+                "enabled": True,
+                "version": "1.0.0",
+                "cross_platform": True,
+                "features": [
+                    "Agent handoff automation",
+                    "Changelog management",
+                    "Documentation tracking",
+                    "Cost optimization",
+                    "Cross-IDE compatibility"
+                ]
+            },
+            "statistics": {
+                "total_files": 0,
+                "documented_functions": 0,
+                "missing_breadcrumbs": []
+            }
+        }
 
-### After Setup - Important Next Steps:
-1. **Edit `workflow_config.json`** with your project-specific details:
-   - Update `project_name` and `technology_stack`
-   - Add `main_files` and `important_directories`
-   - Customize integration notes for your development workflow
+        self._write_if_absent("codebase_summary/codebase_summary.json", _dumps_json(codebase_summary),
+                              label="📊 Created codebase_summary.json")
 
-2. **AI Agent Onboarding Process**:
-   - The AI agent you're working with should **analyze your project structure**
-   - Ask the agent to **update workflow_config.json** with detected technology stack
-   - Request the agent to **configure project-specific settings** based on your codebase
+    def _handle_gitignore(self):
+        """Handle .gitignore file - merge with existing or create new, returning the progress message"""
+        gitignore_path = self.project_root / ".gitignore"
 
-### Example Agent Instructions:
-```
-"Analyze this project and update workflow_config.json with the correct technology stack, main files, and project-specific configuration. This is a [your-tech-stack] project with [key-features]."
-```
+        # Read existing .gitignore once as raw bytes so the marker check never decodes it
+        try:
+            existing = gitignore_path.read_bytes()
+        except FileNotFoundError:
+            existing = None
 
-### What the AI Agent Should Configure:
-- **Technology Stack Detection** (Vite, React, Three.js, SpacetimeDB, etc.)
-- **Main Files Identification** (package.json, vite.config.ts, src/main.tsx)
-- **Important Directories** (src, public, components, etc.)
-- **Integration Notes** for your specific development workflow
+        if existing is not None:
+            # Check if Arkival entries already exist
+            if b"Arkival-specific entries" in existing:
+                return "✅ .gitignore already contains Arkival entries"
 
-## IDE Integration Features
-- **Detected IDE**: {self.detected_ide.upper()}
-- **Workflow Method**: {self._get_workflow_method()}
-- **Task Runner**: {self._get_task_runner()}
+            # Append Arkival entries - append mode never rewrites the user's existing lines
+            with open(gitignore_path, 'ab') as f:
+                f.write(b"\n" + ARKIVAL_GITIGNORE_ENTRIES)
+            return "📝 Appended Arkival entries to existing .gitignore"
+        else:
+            # Create new .gitignore with standard entries plus Arkival entries
+            gitignore_path.write_bytes(STANDARD_GITIGNORE + ARKIVAL_GITIGNORE_ENTRIES)
+            return "📄 Created .gitignore with Arkival entries"
 
-## Troubleshooting
-- Ensure Python 3.7+ is available in your terminal
-- Check that all files in `codebase_summary/` directory exist
-- Verify workflow configuration files are present
-- If workflow_config.json needs updates, ask your AI agent to analyze and configure it
+    def _create_community_standards_files(self):
+        """Create GitHub community standards files"""
+        # Create arkival_docs directory if not exists
+        arkival_docs_dir = self._p("arkival_docs")
+        os.makedirs(arkival_docs_dir, exist_ok=True)
+
+        # The .gitignore merge and the LICENSE (Attribution to Spitfire Products), CONTRIBUTING.md and
+        # SECURITY.md writes touch disjoint files, so all four are issued concurrently; results come back in order
+        with ThreadPoolExecutor(max_workers=len(COMMUNITY_FILES) + 1) as executor:
+            gitignore_result = executor.submit(self._handle_gitignore)
+            created = list(executor.map(
+                lambda item: self._create_file(os.path.join(arkival_docs_dir, item[0]), item[1]),
+                COMMUNITY_FILES
+            ))
+
+        self._info(gitignore_result.result())
+        for (filename, _), was_created in zip(COMMUNITY_FILES, created):
+            if was_created:
+                self._info(f"📄 Created arkival_docs/{filename}")
+            else:
+                self._info(f"⏭️  Skipping arkival_docs/{filename} - already exists")
 
-## Customization
-Edit `workflow_config.json` to customize the system for your project needs, or ask your AI agent to configure it based on your project structure.
-"""
+    def _setup_ide_integration(self):
+        """Set up IDE-specific integration files"""
+        ide = self.detected_ide
 
-        return base_guide
+        # SAFETY CHECK: Never overwrite existing files - content is only generated for files that do not exist yet
+        if self._create_file(self._p("SETUP_GUIDE.md"), self._generate_setup_guide):
+            self._info(f"📖 Created setup guide for {ide.upper()}")
+        else:
+            self._info("⏭️  Skipping SETUP_GUIDE.md - already exists (preserving existing file)")
 
-    def _create_vscode_settings(self):
-        """Create VS Code specific settings"""
-        vscode_settings = {
-            "python.defaultInterpreterPath": "python3",
-            "terminal.integrated.defaultProfile.linux": "bash",
-            "terminal.integrated.defaultProfile.osx": "zsh",
-            "files.associations": {
-                "*.json": "jsonc"
-            },
-            "json.schemas": [
-                {
-                    "fileMatch": ["workflow_config.json"],
-                    "schema": {
-                        "type": "object",
-                        "properties": {
-                            "project_name": {"type": "string"},
-                            "version": {"type": "string"},
-                            "workflow_settings": {"type": "object"}
-                        }
-                    }
-                }
-            ]
-        }
+        if ide in VSCODE_IDES:
+            os.makedirs(self._p(".vscode"), exist_ok=True)
+            if self._create_file(self._p(".vscode/settings.json"), self._generate_vscode_settings):
+                self._info("⚙️  Created VS Code settings.json")
+            else:
+                self._info("⏭️  Skipping .vscode/settings.json - already exists (preserving existing settings)")
 
-        vscode_dir = self.project_root / ".vscode"
-        vscode_dir.mkdir(exist_ok=True)
-        settings_path = vscode_dir / "settings.json"
+    def _generate_setup_guide(self):
+        """Generate IDE-specific setup guide"""
+        ide = self.detected_ide
+        return SETUP_GUIDE_TEMPLATE.format(
+            ide=ide.upper(),
+            run_snippet=IDE_RUN_SNIPPETS.get(ide, DEFAULT_RUN_SNIPPET),
+            workflow_method=self._get_workflow_method(),
+            task_runner=self._get_task_runner()
+        )
 
-        # SAFETY CHECK: Never overwrite existing VS Code settings
-        if settings_path.exists():
-            print("⏭️  Skipping .vscode/settings.json - already exists (preserving existing settings)")
-        else:
-            with open(settings_path, 'w', encoding='utf-8') as f:
-                json.dump(vscode_settings, f, indent=2)
-            print("⚙️  Created VS Code settings.json")
+    def _generate_vscode_settings(self):
+        """Generate VS Code specific settings"""
+        return VSCODE_SETTINGS_JSON
 
     def _run_system_verification(self):
         """Verify system setup (enhanced)"""
-        required_files = [
-            "codebase_summary/agent_workflow_orchestrator.py",
-            "codebase_summary/update_changelog.py",
-            "changelog_summary.json",
-            "NEW_AGENT_GREETING.md",
-            "workflow_config.json",
-            "SETUP_GUIDE.md"
-        ]
-
-        # Add IDE-specific verification
-        if self.detected_ide in ['vscode', 'cursor', 'codespaces']:
-            required_files.extend([".vscode/tasks.json", ".vscode/settings.json"])
-        elif self.detected_ide == 'gitpod':
-            required_files.append(".gitpod.yml")
-        else:
-            required_files.extend([
-                ".workflow_system/scripts/agent_incoming.sh",
-                ".workflow_system/scripts/agent_outgoing.sh"
-            ])
-
-        print(f"\n🔍 VERIFYING SYSTEM SETUP FOR {self.detected_ide.upper()}...")
-        all_good = True
+        ide_label = self.detected_ide.upper()
+        required_files = REQUIRED_FILES_BY_IDE.get(self.detected_ide, REQUIRED_FILES_BY_IDE['default'])
+        present = self._check_files_present(required_files)
+        all_good = all(present.values())
 
+        self._info(f"\n🔍 VERIFYING SYSTEM SETUP FOR {ide_label}...")
         for file_path in required_files:
-            file_full_path = self.project_root / file_path
-            if file_full_path.exists():
-                print(f"✅ {file_path}")
+            if present[file_path]:
+                self._info(f"✅ {file_path}")
             else:
-                print(f"❌ {file_path} - MISSING")
-                all_good = False
+                self._info(f"❌ {file_path} - MISSING")
 
         if all_good:
-            print("✅ All required files present")
-            print(f"🎯 System ready for {self.detected_ide.upper()} environment")
+            self._info("✅ All required files present")
+            self._info(f"🎯 System ready for {ide_label} environment")
         else:
-            print("❌ Some files are missing - setup may be incomplete")
+            self._info("❌ Some files are missing - setup may be incomplete")
 
         return all_good
 
+    def _check_files_present(self, rel_paths):
+        """Check which project-relative files exist using one directory listing per parent"""
+        listings = {}
+        present = {}
+        for rel_path in rel_paths:
+            # Files already confirmed by an earlier pass are not probed again
+            if rel_path in self._verified_files:
+                present[rel_path] = self._verified_files[rel_path]
+                continue
+            parent, _, name = rel_path.rpartition('/')
+            if parent not in listings:
+                try:
+                    with os.scandir(self._p(parent)) as entries:
+                        listings[parent] = {entry.name for entry in entries}
+                except OSError:
+                    listings[parent] = set()
+            present[rel_path] = name in listings[parent]
+        self._verified_files.update(present)
+        return present
+
     def _validate_deployment(self):
         """Validate deployment configuration"""
         issues = []
         
         # Check workflow_config.json
         config_path = self.project_root / "workflow_config.json"
-        if config_path.exists():
+        if self._check_files_present(("workflow_config.json",))["workflow_config.json"]:
             try:
-                with open(config_path, 'r') as f:
-                    config = json.load(f)
-                    
+                config = json.loads(config_path.read_text(encoding='utf-8'))
+
                 if "NEEDS_CONFIGURATION" in config.get("technology_stack", []):
                     issues.append("⚠️  Technology stack needs AI agent configuration")
                     
@@ -1624,20 +1902,26 @@ Edit `workflow_config.json` to customize the system for your project needs, or a
             
         return len(issues) == 0
 
+    def _run_deployment_validator(self):
+        """Run validate_deployment's export package validation in-process from the project root"""
+        import validate_deployment
+        with contextlib.chdir(self.project_root):
+            return validate_deployment.validate_export_package()
+
     def _run_comprehensive_validation(self):
         """Run the comprehensive deployment validation script"""
+        import io
+
         try:
-            import subprocess
-            result = subprocess.run([
-                "python3", "validate_deployment.py"
-            ], capture_output=True, text=True, cwd=self.project_root)
-            
-            if result.returncode == 0:
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                passed = self._run_deployment_validator()
+
+            if passed:
                 print("✅ Comprehensive validation passed")
             else:
                 print("⚠️  Comprehensive validation found issues:")
-                print(result.stdout)
-                print(result.stderr)
+                print(output.getvalue())
         except Exception as e:
             print(f"⚠️  Could not run comprehensive validation: {e}")
             print("💡 You can run it manually: python3 validate_deployment.py")
@@ -1650,12 +1934,7 @@ Edit `workflow_config.json` to customize the system for your project needs, or a
             
             if response in ['y', 'yes']:
                 print("\n🧪 Running basic enhanced features test...")
-                import subprocess
-                result = subprocess.run([
-                    "python3", "validate_deployment.py"
-                ], cwd=self.project_root)
-                
-                if result.returncode == 0:
+                if self._run_deployment_validator():
                     print("\n✅ Basic testing completed successfully!")
                 else:
                     print("\n⚠️  Basic testing found some issues - review output above")
@@ -1674,11 +1953,12 @@ Edit `workflow_config.json` to customize the system for your project needs, or a
         - Creates .md report for validating setup behavior
         - Used by: source repository testing, setup validation, deployment verification
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(self._started_at))
         report_path = self.project_root / f"SETUP_SIMULATION_REPORT_{timestamp}.md"
         
-        report_content = f"""# Arkival Setup Simulation Report
-*Generated: {datetime.now().isoformat()}*
+        parts = []
+        parts.append(f"""# Arkival Setup Simulation Report
+*Generated: {self._now_iso}*
 *Mode: Source Repository Simulation*
 
 ## Detection Results
@@ -1691,11 +1971,11 @@ Edit `workflow_config.json` to customize the system for your project needs, or a
 ## Deployment Logic Analysis
 
 ### If deployed as NEW PROJECT:
-"""
+""")
 
         # Simulate new project setup
         if self.deployment_context != 'existing_project_integration':
-            report_content += """
+            parts.append("""
 **Files that would be created:**
 1. `workflow_config.json` - Main workflow configuration
 2. `codebase_summary/codebase_summary.json` - Initial project analysis
@@ -1719,9 +1999,9 @@ project-root/
 - Generated JSON files
 - .workflow_system/ directory
 - IDE-specific temp files
-"""
+""")
         else:
-            report_content += """
+            parts.append("""
 **Files that would be created:**
 1. `arkival_config.json` - Subdirectory mode trigger (ROOT ONLY)
 
@@ -1734,9 +2014,9 @@ existing-project/
     ├── export_package/
     └── [all arkival files]
 ```
-"""
+""")
 
-        report_content += f"""
+        parts.append(f"""
 
 ### Current Architecture Analysis:
 - **Technology Stack**: {', '.join(self.existing_architecture.get('technology_stack', ['None detected']))}
@@ -1759,7 +2039,7 @@ existing-project/
 ## Validation Results:
 - **Path Resolution**: Would work correctly
 - **IDE Integration**: {self.detected_ide} support available
-- **Cross-Platform**: Compatible with {platform.system()}
+- **Cross-Platform**: Compatible with {self._platform}
 
 ## Recommended Testing:
 1. Deploy to test project: `mkdir test-project && cd test-project`
@@ -1769,11 +2049,10 @@ existing-project/
 
 ---
 *This simulation prevents modifications to the source repository while validating setup logic.*
-"""
+""")
+
+        _atomic_write(report_path, "".join(parts))
 
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(report_content)
-        
         print(f"📋 Simulation report generated: {report_path.name}")
         print("🔍 Review the report to validate setup behavior")
         print("💡 To test actual setup, deploy to a separate directory")
@@ -1792,6 +2071,7 @@ def main():
     print("🚀 Arkival Workflow System Setup")
     print("=" * 50)
 
+    setup = None
     try:
         setup = WorkflowSystemSetup()
         
@@ -1815,14 +2095,21 @@ def main():
         else:
             setup.setup_new_project()
             
-        print("\n✅ Arkival Workflow System setup completed!")
-        print("🎯 Your development environment is now ready for AI collaboration")
+        setup._info("\n✅ Arkival Workflow System setup completed!")
+        setup._info("🎯 Your development environment is now ready for AI collaboration")
+        setup._flush_log()
         
     except Exception as e:
+        if setup is not None:
+            setup._flush_log()
         print(f"\n❌ Setup failed: {e}")
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        # Queued progress is never dropped, even on KeyboardInterrupt
+        if setup is not None:
+            setup._flush_log()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -10,19 +10,32 @@ import os
 import sys
 import datetime
 from pathlib import Path
+from functools import lru_cache
 from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # Optional speedup - the standard json module is the fallback
+    orjson = None
 
 def find_arkival_paths():
     """
     # @codebase-summary: Universal path resolution for Arkival subdirectory deployment
     - Detects deployment mode and returns all required file paths for export validation
     - Used by export readiness validation system to locate and verify core files
+    - Resolved once per working directory; later calls reuse the cached result
     
     Universal path resolution for Arkival subdirectory deployment
     Returns: Dict with all required paths
     """
-    current_dir = Path.cwd()
+    return _resolve_arkival_paths(Path.cwd())
+
+@lru_cache(maxsize=4)
+def _resolve_arkival_paths(current_dir):
+    """Resolve the Arkival paths for current_dir (cached - callers must not mutate the returned dict)"""
     project_root = None
+    has_config = False
     
     # Check if we're running from within the codebase_summary directory
     if current_dir.name == "codebase_summary" and current_dir.parent.name != "Arkival":
@@ -32,33 +45,28 @@ def find_arkival_paths():
     else:
         is_in_scripts_dir = False
         
-        # Search upward for arkival_config.json
-        search_path = current_dir
-        for _ in range(5):  # Max 5 levels up
-            if (search_path / "arkival_config.json").exists():
+        # Search upward (max 5 levels) for arkival_config.json, listing each level once; the
+        # nearest Arkival directory is remembered as the fallback indicator along the way
+        arkival_parent = None
+        for search_path in [current_dir, *current_dir.parents][:5]:
+            try:
+                entries = set(os.listdir(search_path))
+            except OSError:
+                continue
+            if "arkival_config.json" in entries:
                 project_root = search_path
+                has_config = True
                 break
-            if search_path.parent == search_path:  # Reached filesystem root
-                break
-            search_path = search_path.parent
-        
-        # Try alternative detection methods
-        if not project_root:
-            # Look for Arkival directory as indicator
-            search_path = current_dir
-            for _ in range(5):
-                if (search_path / "Arkival").exists():
-                    project_root = search_path
-                    break
-                search_path = search_path.parent
+            if arkival_parent is None and "Arkival" in entries:
+                arkival_parent = search_path
         
-        # Fallback - assume current directory
+        # Fallback - nearest Arkival directory, else assume current directory
         if not project_root:
-            project_root = current_dir
+            project_root = arkival_parent or current_dir
     
     # Determine deployment mode
     if current_dir.name.lower() in ['arkival', 'arkival-v4'] or (
-        not is_in_scripts_dir and (project_root / "arkival_config.json").exists()
+        not is_in_scripts_dir and has_config
     ):
         # Subdirectory deployment mode
         arkival_dir = current_dir if current_dir.name.lower() in ['arkival', 'arkival-v4'] else project_root
@@ -70,6 +78,7 @@ def find_arkival_paths():
             'codebase_summary': arkival_dir / "codebase_summary.json",
             'changelog_summary': arkival_dir / "changelog_summary.json",
             'missing_breadcrumbs': arkival_dir / "codebase_summary" / "missing_breadcrumbs.json",
+            'workflow_config': arkival_dir / "workflow_config.json",
             'manifest_file': arkival_dir / "EXPORT_PACKAGE_MANIFEST.json"
         }
     else:
@@ -87,9 +96,66 @@ def find_arkival_paths():
             'codebase_summary': project_root / "codebase_summary.json",
             'changelog_summary': project_root / "changelog_summary.json",
             'missing_breadcrumbs': scripts_dir / "missing_breadcrumbs.json",
+            'workflow_config': project_root / "workflow_config.json",
             'manifest_file': project_root / "EXPORT_PACKAGE_MANIFEST.json"
         }
 
+# Core system files that must exist under arkival_dir, in report order
+REQUIRED_CORE_FILES = (
+    "setup_workflow_system.py",
+    "validate_deployment.py",
+    "workflow_config.json",
+    "codebase_summary/agent_workflow_orchestrator.py",
+    "codebase_summary/update_project_summary.py",
+    "codebase_summary/update_changelog.py",
+    "README.md",
+    "AGENT_GUIDE.md",
+    ".scanignore"
+)
+
+REQUIRED_DOC_FILES = (
+    "README.md",
+    "AGENT_GUIDE.md",
+    "CODEBASE_SUMMARY.md",
+    "ARCHITECTURE_DIAGRAM.md",
+    "CONTRIBUTING.md",
+    "SECURITY.md",
+    "CHANGELOG.md"
+)
+
+# (report name, find_arkival_paths key) for each JSON file whose syntax is validated
+CONFIG_FILES = (
+    ("workflow_config.json", 'workflow_config'),
+    ("codebase_summary.json", 'codebase_summary'),
+    ("changelog_summary.json", 'changelog_summary'),
+    ("missing_breadcrumbs.json", 'missing_breadcrumbs')
+)
+
+# Readiness manifest written into arkival_dir by _generate_export_manifest
+READINESS_MANIFEST_FILE = "EXPORT_READINESS_MANIFEST.json"
+
+# JSON files at least this large are parsed straight from a read-only mmap when orjson is available
+MMAP_THRESHOLD_BYTES = 1 << 20
+
+def _read_json(path):
+    """Load one JSON file with a single read, parsed by orjson when it is installed"""
+    with open(path, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD_BYTES:
+            # Large files (e.g. a long changelog) are parsed from the page cache without a bytes copy
+            import mmap
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    return json.loads(data)
+
+def _dumps_json(obj):
+    """Serialize obj to 2-space indented JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
 class ExportReadinessValidator:
     """
     # @codebase-summary: Export readiness validation system
@@ -99,16 +165,47 @@ class ExportReadinessValidator:
     - Creates deployment-ready package validation
     """
     
-    def __init__(self):
+    def __init__(self, strict=False):
         self.paths = find_arkival_paths()
+        # strict: keep running every phase even after required core files are found missing
+        self.strict = strict
+        # One UTC timestamp for the whole run, shared by the results and the generated manifest
+        now_utc = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        self._now_iso = now_utc.isoformat() + "Z"
         self.validation_results = {
-            "timestamp": datetime.datetime.now().isoformat() + "Z",
+            "timestamp": self._now_iso,
             "status": "UNKNOWN",
             "errors": [],
             "warnings": [],
             "metrics": {}
         }
+        self._json_cache = {}
+        self._dir_listings = {}
     
+    def _files_present(self, rel_paths):
+        """Map each arkival_dir-relative path to whether it is a file, listing each parent directory once"""
+        base = str(self.paths['arkival_dir'])
+        present = {}
+        for rel_path in rel_paths:
+            parent, _, name = rel_path.rpartition('/')
+            if parent not in self._dir_listings:
+                try:
+                    # DirEntry.is_file() uses the d_type from the listing - no extra stat per name
+                    with os.scandir(os.path.join(base, parent)) as entries:
+                        self._dir_listings[parent] = {entry.name for entry in entries if entry.is_file()}
+                except OSError:
+                    self._dir_listings[parent] = set()
+            present[rel_path] = name in self._dir_listings[parent]
+        return present
+
+    def _load_json(self, path):
+        """Parse a JSON file once per modification time so later phases reuse the parsed data"""
+        mtime_ns = os.stat(path).st_mtime_ns
+        cached = self._json_cache.get(path)
+        if cached is None or cached[0] != mtime_ns:
+            cached = self._json_cache[path] = (mtime_ns, _read_json(path))
+        return cached[1]
+
     def validate_complete_system(self) -> Dict[str, Any]:
         """
         # @codebase-summary: Complete system validation for export readiness
@@ -116,12 +213,19 @@ class ExportReadinessValidator:
         - Collects current project metrics
         - Generates updated export manifest
         - Returns comprehensive readiness report
+        - Stops after the core file check when files are missing unless strict
         """
         print("🚀 EXPORT READINESS VALIDATION")
         print("=" * 50)
         
         # Step 1: Validate core system files
-        self._validate_core_files()
+        missing_core = self._validate_core_files()
+        if missing_core and not self.strict:
+            # The export cannot pass - skip the metric, config, doc and manifest passes
+            print(f"⏭️  Skipping remaining checks ({len(missing_core)} core files missing; use --strict for a full scan)")
+            self._discard_stale_manifest()
+            self._assess_export_readiness()
+            return self.validation_results
         
         # Step 2: Collect current metrics
         self._collect_current_metrics()
@@ -144,65 +248,58 @@ class ExportReadinessValidator:
         """Validate all core system files exist"""
         print("📁 Validating core system files...")
         
-        required_files = [
-            "setup_workflow_system.py",
-            "validate_deployment.py", 
-            "workflow_config.json",
-            "codebase_summary/agent_workflow_orchestrator.py",
-            "codebase_summary/update_project_summary.py",
-            "codebase_summary/update_changelog.py",
-            "README.md",
-            "AGENT_GUIDE.md",
-            ".scanignore"
-        ]
-        
         missing_files = []
-        for file_path in required_files:
-            full_path = self.paths['arkival_dir'] / file_path
-            if full_path.exists():
-                print(f"  ✅ {file_path}")
+        present = self._files_present(REQUIRED_CORE_FILES)
+        lines = []
+        for file_path in REQUIRED_CORE_FILES:
+            if present[file_path]:
+                lines.append(f"  ✅ {file_path}\n")
             else:
-                print(f"  ❌ {file_path} - MISSING")
+                lines.append(f"  ❌ {file_path} - MISSING\n")
                 missing_files.append(file_path)
+        sys.stdout.write("".join(lines))
         
         if missing_files:
             self.validation_results["errors"].extend([f"Missing file: {f}" for f in missing_files])
+        return missing_files
     
     def _collect_current_metrics(self):
         """Collect current project metrics from live data"""
         print("📊 Collecting current project metrics...")
         
         try:
-            # Get codebase summary metrics
-            with open(self.paths['codebase_summary'], 'r') as f:
-                codebase_data = json.load(f)
-            
-            # Get documentation metrics
-            with open(self.paths['missing_breadcrumbs'], 'r') as f:
-                breadcrumb_data = json.load(f)
+            # Load codebase summary, documentation and changelog metrics concurrently - the reads are
+            # independent I/O; results (and the first failure) still come back in this order
+            metric_sources = (
+                self.paths['codebase_summary'],
+                self.paths['missing_breadcrumbs'],
+                self.paths['changelog_summary']
+            )
+            with ThreadPoolExecutor(max_workers=len(metric_sources)) as pool:
+                codebase_data, breadcrumb_data, changelog_data = pool.map(self._load_json, metric_sources)
             
-            # Get changelog metrics
-            with open(self.paths['changelog_summary'], 'r') as f:
-                changelog_data = json.load(f)
-            
-            # Compile current metrics
+            # Compile current metrics - each nested section is looked up once
+            structure = codebase_data.get("project_structure") or {}
+            summary = breadcrumb_data.get("summary") or {}
+            statistics = changelog_data.get("statistics") or {}
             self.validation_results["metrics"] = {
                 "project_version": codebase_data.get("version", "1.0.0"),
                 "changelog_version": changelog_data.get("changelog_version", "1.0.0"),
-                "total_files": codebase_data.get("project_structure", {}).get("total_files", 0),
-                "total_functions": breadcrumb_data.get("summary", {}).get("total_functions", 0),
-                "documented_functions": breadcrumb_data.get("summary", {}).get("documented_functions", 0),
-                "missing_breadcrumbs": breadcrumb_data.get("summary", {}).get("missing_count", 0),
-                "documentation_coverage": breadcrumb_data.get("summary", {}).get("coverage_percentage", 0),
-                "changelog_entries": changelog_data.get("statistics", {}).get("total_entries", 0),
+                "total_files": structure.get("total_files", 0),
+                "total_functions": summary.get("total_functions", 0),
+                "documented_functions": summary.get("documented_functions", 0),
+                "missing_breadcrumbs": summary.get("missing_count", 0),
+                "documentation_coverage": summary.get("coverage_percentage", 0),
+                "changelog_entries": statistics.get("total_entries", 0),
                 "last_updated": codebase_data.get("updated_at", ""),
                 "ai_providers": len(codebase_data.get("ai_providers", [])),
                 "architecture_patterns": len(codebase_data.get("architecture_patterns", []))
             }
             
-            print(f"  ✅ Version: {self.validation_results['metrics']['project_version']}")
-            print(f"  ✅ Functions: {self.validation_results['metrics']['total_functions']}")
-            print(f"  ✅ Documentation: {self.validation_results['metrics']['documentation_coverage']:.1f}%")
+            metrics = self.validation_results["metrics"]
+            print(f"  ✅ Version: {metrics['project_version']}")
+            print(f"  ✅ Functions: {metrics['total_functions']}")
+            print(f"  ✅ Documentation: {metrics['documentation_coverage']:.1f}%")
             
         except Exception as e:
             self.validation_results["errors"].append(f"Failed to collect metrics: {e}")
@@ -212,22 +309,16 @@ class ExportReadinessValidator:
         """Validate all JSON configuration files"""
         print("⚙️  Validating configuration files...")
         
-        config_files = [
-            ("workflow_config.json", self.paths['arkival_dir'] / "workflow_config.json"),
-            ("codebase_summary.json", self.paths['codebase_summary']),
-            ("changelog_summary.json", self.paths['changelog_summary']),
-            ("missing_breadcrumbs.json", self.paths['missing_breadcrumbs'])
-        ]
-        
-        for name, path in config_files:
+        for name, path_key in CONFIG_FILES:
+            path = self.paths[path_key]
+            # One stat + read per file: the load doubles as the existence check, and files already
+            # parsed by the metrics pass come straight from the cache
             try:
-                if path.exists():
-                    with open(path, 'r') as f:
-                        json.load(f)  # Validate JSON syntax
-                    print(f"  ✅ {name} - Valid JSON")
-                else:
-                    print(f"  ⚠️  {name} - Missing")
-                    self.validation_results["warnings"].append(f"Missing config: {name}")
+                self._load_json(path)
+                print(f"  ✅ {name} - Valid JSON")
+            except FileNotFoundError:
+                print(f"  ⚠️  {name} - Missing")
+                self.validation_results["warnings"].append(f"Missing config: {name}")
             except json.JSONDecodeError as e:
                 print(f"  ❌ {name} - Invalid JSON: {e}")
                 self.validation_results["errors"].append(f"Invalid JSON in {name}: {e}")
@@ -236,24 +327,16 @@ class ExportReadinessValidator:
         """Validate documentation completeness"""
         print("📚 Validating documentation...")
         
-        doc_files = [
-            "README.md",
-            "AGENT_GUIDE.md",
-            "CODEBASE_SUMMARY.md",
-            "ARCHITECTURE_DIAGRAM.md",
-            "CONTRIBUTING.md",
-            "SECURITY.md",
-            "CHANGELOG.md"
-        ]
-        
         missing_docs = []
-        for doc in doc_files:
-            doc_path = self.paths['arkival_dir'] / doc
-            if doc_path.exists():
-                print(f"  ✅ {doc}")
+        present = self._files_present(REQUIRED_DOC_FILES)
+        lines = []
+        for doc in REQUIRED_DOC_FILES:
+            if present[doc]:
+                lines.append(f"  ✅ {doc}\n")
             else:
-                print(f"  ❌ {doc} - Missing")
+                lines.append(f"  ❌ {doc} - Missing\n")
                 missing_docs.append(doc)
+        sys.stdout.write("".join(lines))
         
         if missing_docs:
             self.validation_results["errors"].extend([f"Missing documentation: {d}" for d in missing_docs])
@@ -269,7 +352,7 @@ class ExportReadinessValidator:
             manifest = {
                 "package_name": "Arkival V4 - Cross-Platform Workflow Export Package",
                 "version": current_metrics.get("project_version", "1.0.0"),
-                "export_date": datetime.datetime.now().isoformat() + "Z",
+                "export_date": self._now_iso,
                 "status": "VALIDATING",
                 "confidence_level": "HIGH" if len(self.validation_results["errors"]) == 0 else "MEDIUM",
                 "validation_timestamp": self.validation_results["timestamp"]
@@ -291,9 +374,9 @@ class ExportReadinessValidator:
             }
             
             # Write updated manifest (this file should be gitignored)
-            manifest_output_path = self.paths['arkival_dir'] / "EXPORT_READINESS_MANIFEST.json"
-            with open(manifest_output_path, 'w') as f:
-                json.dump(manifest, f, indent=2)
+            manifest_output_path = self.paths['arkival_dir'] / READINESS_MANIFEST_FILE
+            with open(manifest_output_path, 'wb') as f:
+                f.write(_dumps_json(manifest))
             
             print(f"  ✅ Updated manifest written to: {manifest_output_path}")
             
@@ -301,6 +384,17 @@ class ExportReadinessValidator:
             self.validation_results["errors"].append(f"Failed to generate manifest: {e}")
             print(f"  ❌ Failed to generate manifest: {e}")
     
+    def _discard_stale_manifest(self):
+        """Remove a manifest left by an earlier run when this run does not regenerate it"""
+        manifest_path = self.paths['arkival_dir'] / READINESS_MANIFEST_FILE
+        try:
+            manifest_path.unlink()
+            print(f"  🗑️  Removed stale {READINESS_MANIFEST_FILE} - not regenerated for a failing run")
+        except FileNotFoundError:
+            print(f"  ⏭️  {READINESS_MANIFEST_FILE} not generated for a failing run")
+        except OSError as e:
+            print(f"  ⚠️  Could not remove stale {READINESS_MANIFEST_FILE}: {e}")
+    
     def _assess_export_readiness(self):
         """Final assessment of export readiness"""
         print("🎯 Assessing export readiness...")
@@ -336,19 +430,20 @@ def main():
     """
     if len(sys.argv) > 1 and sys.argv[1] == "--help":
         print("Export Readiness Validation Script")
-        print("Usage: python3 validate_export_readiness.py")
+        print("Usage: python3 validate_export_readiness.py [--strict]")
         print("\nValidates system is ready for GitHub deployment with current metrics")
         print("Generates EXPORT_READINESS_MANIFEST.json (excluded from git)")
+        print("\n  --strict   Run every check even when core files are missing")
         return
     
-    validator = ExportReadinessValidator()
+    validator = ExportReadinessValidator(strict="--strict" in sys.argv[1:])
     results = validator.validate_complete_system()
     
     # Save detailed results (this file should be gitignored)
     results_path = validator.paths['arkival_dir'] / "EXPORT_VALIDATION_RESULTS.json"
     try:
-        with open(results_path, 'w') as f:
-            json.dump(results, f, indent=2)
+        with open(results_path, 'wb') as f:
+            f.write(_dumps_json(results))
         print(f"\n📋 Detailed results saved to: {results_path}")
     except Exception as e:
         print(f"\n⚠️  Could not save results: {e}")